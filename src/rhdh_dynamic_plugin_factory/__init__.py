@@ -29,6 +29,7 @@ from .source_config import (
 from .utils import (
     clean_directory,
     display_export_results,
+    is_empty_directory,
     prompt_or_clean_directory,
     repo_dir_name,
     run_command_with_streaming,
@@ -57,6 +58,7 @@ __all__ = [
     "run_command_with_streaming",
     "display_export_results",
     "clean_directory",
+    "is_empty_directory",
     "prompt_or_clean_directory",
     "repo_dir_name",
     # Version
@@ -5,9 +5,9 @@ Main entry point for the RHDH Plugin Factory CLI.
 import sys
 from pathlib import Path
 
-try:
+if __package__:
     from .cli import main  # For module execution
-except ImportError:
+else:
     # For direct directory execution
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from rhdh_dynamic_plugin_factory.cli import main
@@ -4,16 +4,20 @@ Command-line interface for RHDH Plugin Factory - Setup and orchestration tool.
 
 import argparse
 import json
+import logging
 import os
+import shutil
 import sys
 from pathlib import Path
+from typing import Any, NoReturn
 
 # Handle both direct script execution and module execution
-try:
+if __package__:
     from .__version__ import __version__
     from .config import PluginFactoryConfig
+    from .constants import PKG_JSON, RESOURCE_METADATA_FILE, SKIP_DIRS
     from .exceptions import ConfigurationError, ExecutionError, PluginFactoryError
-    from .logger import get_logger, setup_logging
+    from .logger import LEVELS, get_logger, setup_logging
     from .source_config import (
         WorkspaceInfo,
         clone_workspaces_with_worktrees,
@@ -21,20 +25,22 @@ try:
     )
     from .utils import (
         collect_build_logs,
+        load_env_file,
         prompt_or_clean_directory,
         run_command_with_streaming,
     )
-except ImportError:
+else:
     # For direct script execution, add parent directory to path
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from rhdh_dynamic_plugin_factory.__version__ import __version__
     from rhdh_dynamic_plugin_factory.config import PluginFactoryConfig
+    from rhdh_dynamic_plugin_factory.constants import PKG_JSON, RESOURCE_METADATA_FILE, SKIP_DIRS
     from rhdh_dynamic_plugin_factory.exceptions import (
         ConfigurationError,
         ExecutionError,
         PluginFactoryError,
     )
-    from rhdh_dynamic_plugin_factory.logger import get_logger, setup_logging
+    from rhdh_dynamic_plugin_factory.logger import LEVELS, get_logger, setup_logging
     from rhdh_dynamic_plugin_factory.source_config import (
         WorkspaceInfo,
         clone_workspaces_with_worktrees,
@@ -42,21 +48,23 @@ except ImportError:
     )
     from rhdh_dynamic_plugin_factory.utils import (
         collect_build_logs,
+        load_env_file,
         prompt_or_clean_directory,
         run_command_with_streaming,
     )
 
 logger = get_logger("cli")
 
-_PROJECT_ROOT = Path(__file__).parent.parent.parent
+# Keep corepack from prompting before it downloads the pinned yarn version. Set on
+# os.environ so every command inherits it, unless the user chose a value themselves.
+os.environ.setdefault("COREPACK_ENABLE_DOWNLOAD_PROMPT", "0")
 
 
 def _build_version_string() -> str:
     """Build version string including external resource metadata."""
     lines = [f"rhdh-dynamic-plugin-factory:  {__version__}"]
     try:
-        metadata_path = _PROJECT_ROOT / "resources" / "metadata.json"
-        metadata = json.loads(metadata_path.read_text())
+        metadata = json.loads(RESOURCE_METADATA_FILE.read_text())
         lines.append(f"RHDH commit:                  {metadata['rhdh-hash']}")
         lines.append(f"export-util script commit:    {metadata['export-util-script-hash']}")
     except (FileNotFoundError, KeyError, json.JSONDecodeError):
@@ -64,6 +72,33 @@ def _build_version_string() -> str:
     return "\n".join(lines)
 
 
+class _VersionAction(argparse.Action):
+    """Print the version string and exit, like action="version".
+
+    The string is only built when the flag is actually passed, so ordinary
+    runs do not read resources/metadata.json while constructing the parser.
+    """
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS, help: str | None = None) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help=help or "show program's version number and exit",
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> NoReturn:
+        sys.stdout.write(_build_version_string() + "\n")
+        parser.exit()
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser for the CLI."""
     parser = argparse.ArgumentParser(
@@ -79,11 +114,11 @@ Examples:
         python src/rhdh_dynamic_plugin_factory --source-repo https://github.com/backstage/community-plugins --source-ref main --workspace-path workspaces/todo --config-dir ./config --repo-path ./source --output-dir ./outputs
         """,
     )
-    parser.add_argument("-v", "--version", action="version", version=_build_version_string())
+    parser.add_argument("-v", "--version", action=_VersionAction)
     parser.add_argument(
         "--log-level",
         default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LEVELS,
         help="Set logging level",
     )
     parser.add_argument(
@@ -152,34 +187,98 @@ Examples:
         "listed plugins using dependency analysis. WARNING: This overwrites "
         "your plugins-list.yaml with updated build args.",
     )
+    parser.add_argument(
+        "--force-install",
+        action="store_true",
+        default=False,
+        help="Always run `yarn install`, even if the workspace dependencies are already up to date with yarn.lock.",
+    )
     return parser
 
 
-def install_dependencies(workspace_path: Path) -> None:
+def _dependency_manifests(workspace_path: Path) -> list[Path]:
+    """List the files whose changes can alter what `yarn install` produces.
+
+    That is ``yarn.lock``, ``.yarnrc.yml`` (if present) and every workspace
+    ``package.json``, including the nested ones under e.g. ``plugins/`` that
+    patches and overlays typically edit. Build output, ``node_modules`` and
+    dot directories are not searched.
+    """
+    manifests = [workspace_path / "yarn.lock"]
+    if os.path.isfile(workspace_path / ".yarnrc.yml"):
+        manifests.append(workspace_path / ".yarnrc.yml")
+    for dirpath, dirnames, filenames in os.walk(workspace_path):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+        if PKG_JSON in filenames:
+            manifests.append(Path(dirpath) / PKG_JSON)
+    return manifests
+
+
+def _dependencies_up_to_date(workspace_path: Path) -> bool:
+    """Check whether a previous `yarn install` is still current for the workspace.
+
+    Yarn records every successful install in ``.yarn/install-state.gz``. If that
+    file and ``node_modules`` exist and none of the dependency manifests (see
+    :func:`_dependency_manifests`) has been modified since, re-running the
+    install is a no-op.
+    """
+    try:
+        install_state_mtime = os.stat(workspace_path / ".yarn" / "install-state.gz").st_mtime_ns
+        if not os.path.isdir(workspace_path / "node_modules"):
+            return False
+        # The root package.json must exist for the workspace to have been installed at all
+        if not os.path.isfile(workspace_path / PKG_JSON):
+            return False
+        return all(
+            os.stat(manifest).st_mtime_ns <= install_state_mtime for manifest in _dependency_manifests(workspace_path)
+        )
+    except FileNotFoundError:
+        return False
+
+
+def _corepack_yarn_enabled() -> bool:
+    """Check whether `yarn` on PATH is already the shim installed by `corepack enable`."""
+    yarn_path = shutil.which("yarn")
+    if yarn_path is None:
+        return False
+    return Path(os.path.realpath(yarn_path)).match("corepack/dist/yarn.js")
+
+
+def install_dependencies(workspace_path: Path, force_install: bool = False) -> None:
     """Install dependencies in the workspace using yarn install with corepack.
 
+    Args:
+        workspace_path: Absolute path to the workspace root.
+        force_install: If True, run `yarn install` even when the existing
+            install state is newer than every dependency manifest.
+
     Raises:
         ExecutionError: If any dependency installation step fails.
     """
     logger.info("[bold blue]Installing workspace dependencies[/bold blue]")
+    logger.debug(f"Workspace path: {workspace_path}")
     STEP_NAME = "install dependencies"
 
-    commands = [
-        (["pwd"], "Checking workspace path"),
-        (["corepack", "enable"], "Enabling corepack"),
-        (["yarn", "--version"], "Checking yarn version"),
-        (["yarn", "install", "--immutable"], "Installing dependencies"),
-        (["yarn", "tsc"], "Running TypeScript compilation"),
-    ]
+    commands = []
+    # `corepack enable` boots Node just to (re)create symlinks that survive between runs
+    if _corepack_yarn_enabled():
+        logger.debug("yarn already resolves to the corepack shim, skipping corepack enable")
+    else:
+        commands.append((["corepack", "enable"], "Enabling corepack"))
+    # Each yarn invocation boots Node, so only probe the version when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        commands.append((["yarn", "--version"], "Checking yarn version"))
+    if not force_install and _dependencies_up_to_date(workspace_path):
+        logger.info("[green]Dependencies are up to date with yarn.lock, skipping yarn install[/green]")
+    else:
+        commands.append((["yarn", "install", "--immutable"], "Installing dependencies"))
+    commands.append((["yarn", "tsc"], "Running TypeScript compilation"))
 
     try:
-        env = os.environ.copy()
-        env["COREPACK_ENABLE_DOWNLOAD_PROMPT"] = "0"  # Disable download prompts
-
         for cmd, description in commands:
             logger.info(f"[cyan]{description}[/cyan]")
 
-            returncode = run_command_with_streaming(cmd, logger, cwd=workspace_path, env=env)
+            returncode = run_command_with_streaming(cmd, logger, cwd=workspace_path)
 
             if cmd[:2] == ["yarn", "install"]:
                 collect_build_logs(logger, has_errors=returncode != 0)
@@ -208,6 +307,7 @@ def _process_workspace(
     workspace_path: str,
     output_dir: str,
     generate_build_args: bool = False,
+    force_install: bool = False,
 ) -> None:
     """Execute the plugin factory pipeline for a single workspace.
 
@@ -218,6 +318,7 @@ def _process_workspace(
         workspace_path: Relative path from repo_path to the workspace.
         output_dir: Output directory for build artifacts.
         generate_build_args: If True, (re)compute build args for a user-provided plugins-list.yaml.
+        force_install: If True, run `yarn install` even if dependencies look up to date.
     """
     was_auto_generated = config.discover_plugins_list(
         config_dir=workspace_config_dir,
@@ -234,7 +335,7 @@ def _process_workspace(
 
     logger.info("[bold blue]Installing Dependencies[/bold blue]")
     full_workspace_path = Path(repo_path).joinpath(workspace_path).absolute()
-    install_dependencies(full_workspace_path)
+    install_dependencies(full_workspace_path, force_install=force_install)
 
     if was_auto_generated or generate_build_args:
         config.populate_plugins_build_args(
@@ -265,13 +366,10 @@ def _load_env_for_workspace(
     after load_from_env in _run_multi_workspace). This function restores that
     baseline and layers only the workspace-specific .env on top.
     """
-    from dotenv import load_dotenv
-
     os.environ.clear()
     os.environ.update(base_env)
 
-    if workspace_env_path.exists():
-        load_dotenv(workspace_env_path, override=True)
+    load_env_file(workspace_env_path, override=True)
 
 
 def _run(args: argparse.Namespace) -> None:
@@ -319,13 +417,16 @@ def _run_multi_workspace(args: argparse.Namespace, workspaces: list[WorkspaceInf
     # Warn about any root-level content that is not a workspace or the root .env
     workspace_names = {ws.name for ws in workspaces}
     ignored_items: list[str] = []
-    for entry in sorted(config_dir.iterdir()):
+    with os.scandir(config_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
         if entry.name == ".env":
             continue
         if entry.name in workspace_names:
             continue
-        suffix = "directory — not a workspace, missing source.json" if entry.is_dir() else "file"
-        ignored_items.append(f"  - {entry.name}{'/' if entry.is_dir() else ''} ({suffix})")
+        is_dir = entry.is_dir()
+        suffix = "directory — not a workspace, missing source.json" if is_dir else "file"
+        ignored_items.append(f"  - {entry.name}{'/' if is_dir else ''} ({suffix})")
     if ignored_items:
         items_str = "\n".join(ignored_items)
         logger.warning(
@@ -386,6 +487,7 @@ def _run_multi_workspace(args: argparse.Namespace, workspaces: list[WorkspaceInf
                 workspace_path=ws.source_config.workspace_path,
                 output_dir=str(ws.output_dir),
                 generate_build_args=args.generate_build_args,
+                force_install=args.force_install,
             )
             successes.append(ws.name)
             logger.info(f"[green]Workspace '{ws.name}' export completed successfully[/green]")
@@ -460,11 +562,17 @@ def _run_single_workspace(args: argparse.Namespace) -> None:
         workspace_path=str(config.workspace_path),
         output_dir=str(args.output_dir),
         generate_build_args=args.generate_build_args,
+        force_install=args.force_install,
     )
 
 
 def main() -> None:
     """Main entry point for the RHDH Dynamic Plugin Factory."""
+    # Version probes are common in CI; answer them without building the parser
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        print(_build_version_string())
+        sys.exit(0)
+
     parser = create_parser()
     args = parser.parse_args()
     setup_logging(level=args.log_level, verbose=args.verbose)
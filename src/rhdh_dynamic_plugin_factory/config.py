@@ -3,22 +3,84 @@ Configuration management for RHDH Plugin Factory.
 """
 
 import argparse
+import hashlib
 import os
 import subprocess
+import textwrap
 from dataclasses import dataclass, field
-from logging import Logger
+from logging import INFO, Logger
 from pathlib import Path
 from typing import ClassVar, Optional
 
-import yaml
-from dotenv import load_dotenv
-
-from .constants import PLUGIN_LIST_FILE, SOURCE_CONFIG_FILE
+from .constants import (
+    DEFAULT_ENV_FILE,
+    EXPORT_WORKSPACE_SCRIPT,
+    OVERRIDE_SOURCES_SCRIPT,
+    PLUGIN_LIST_FILE,
+    SOURCE_CONFIG_FILE,
+)
 from .exceptions import ConfigurationError, ExecutionError, PluginFactoryError
 from .logger import get_logger
 from .plugin_list_config import PluginListConfig
 from .source_config import SourceConfig
-from .utils import display_export_results, run_command_with_streaming
+from .utils import (
+    PLAIN_OUTPUT,
+    display_export_results,
+    is_empty_directory,
+    load_env_file,
+    load_yaml,
+    run_command_with_streaming,
+)
+
+# Every variable default.env assigns; when all are already in the environment
+# (e.g. set by the container image) loading default.env cannot change anything
+_DEFAULT_ENV_KEYS = ("RHDH_CLI_VERSION",)
+
+
+@dataclass(frozen=True)
+class _RegistrySettings:
+    """Registry fields of PluginFactoryConfig as read from the environment."""
+
+    url: str | None
+    username: str | None
+    password: str | None
+    namespace: str | None
+    insecure: bool
+    auth_file: str | None
+
+    @classmethod
+    def from_env(cls) -> "_RegistrySettings":
+        """Read the registry settings from a single pass over os.environ."""
+        env = os.environ
+        return cls(
+            url=env.get("REGISTRY_URL"),
+            username=env.get("REGISTRY_USERNAME"),
+            password=env.get("REGISTRY_PASSWORD"),
+            namespace=env.get("REGISTRY_NAMESPACE"),
+            insecure=env.get("REGISTRY_INSECURE", "false").lower() == "true",
+            auth_file=env.get("REGISTRY_AUTH_FILE"),
+        )
+
+
+# Fixed inputs for export-workspace.sh; the per-run values are added in export_plugins
+_EXPORT_ENV_TEMPLATE = {
+    "INPUTS_SCALPRUM_CONFIG_FILE_NAME": "scalprum-config.json",
+    "INPUTS_SOURCE_OVERLAY_FOLDER_NAME": "overlay",
+    "INPUTS_SOURCE_PATCH_FILE_NAME": "patch",
+    "INPUTS_APP_CONFIG_FILE_NAME": "app-config.dynamic.yaml",
+    "INPUTS_CLI_PACKAGE": "@red-hat-developer-hub/cli",
+    "INPUTS_CONTAINER_BUILD_TOOL": "buildah",
+}
+
+
+def _ensure_directory(path: str | Path) -> None:
+    """Create a directory (and parents) unless it already exists.
+
+    On reruns the directories are already there, and a single stat is cheaper
+    than makedirs walking the path only to hit EEXIST.
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
 
 
 @dataclass
@@ -49,6 +111,8 @@ class PluginFactoryConfig:
     push_images: bool = field(default=False)
 
     logger: ClassVar[Logger] = get_logger("config")
+    # Registry URL -> (username, password digest, insecure) of the last successful buildah login in this process
+    _registry_logins: ClassVar[dict[str, tuple[str, str, bool]]] = {}
 
     def __post_init__(self) -> None:
         """Validate configuration fields after initialization.
@@ -104,32 +168,38 @@ class PluginFactoryConfig:
             ConfigurationError: If push_images is enabled and required registry fields are missing.
             ExecutionError: If buildah login fails after credential change.
         """
-        new_url = os.getenv("REGISTRY_URL")
-        new_username = os.getenv("REGISTRY_USERNAME")
-        new_password = os.getenv("REGISTRY_PASSWORD")
-        new_namespace = os.getenv("REGISTRY_NAMESPACE")
-        new_insecure = os.getenv("REGISTRY_INSECURE", "false").lower() == "true"
-        new_auth_file = os.getenv("REGISTRY_AUTH_FILE")
+        new = _RegistrySettings.from_env()
 
+        # The namespace only affects image tags, so changing it alone does not require a new login
         config_changed = (
-            new_url != self.registry_url
-            or new_username != self.registry_username
-            or new_password != self.registry_password
-            or new_insecure != self.registry_insecure
-            or new_auth_file != self.registry_auth_file
+            new.url != self.registry_url
+            or new.username != self.registry_username
+            or new.password != self.registry_password
+            or new.insecure != self.registry_insecure
+            or new.auth_file != self.registry_auth_file
         )
 
-        self.registry_url = new_url
-        self.registry_username = new_username
-        self.registry_password = new_password
-        self.registry_namespace = new_namespace
-        self.registry_insecure = new_insecure
-        self.registry_auth_file = new_auth_file
+        self.registry_url = new.url
+        self.registry_username = new.username
+        self.registry_password = new.password
+        self.registry_namespace = new.namespace
+        self.registry_insecure = new.insecure
+        self.registry_auth_file = new.auth_file
 
         if self.push_images and config_changed:
             self._validate_registry_fields()
             self._buildah_login()
 
+    @classmethod
+    def _load_default_env(cls) -> None:
+        """Load default.env into os.environ unless all of its values are already set."""
+        if all(key in os.environ for key in _DEFAULT_ENV_KEYS):
+            cls.logger.debug(f"Defaults from {DEFAULT_ENV_FILE} are already set in the environment, skipping it")
+            return
+        cls.logger.debug(f"[bold blue]Loading environment variables from {DEFAULT_ENV_FILE}[/bold blue]")
+        if load_env_file(DEFAULT_ENV_FILE):
+            cls.logger.debug(f"[green]Loaded {DEFAULT_ENV_FILE}[/green]")
+
     @classmethod
     def load_from_env(
         cls,
@@ -154,16 +224,9 @@ class PluginFactoryConfig:
             multi_workspace: If True, skip root-level source.json and plugins-list.yaml
                 validation since each workspace manages its own.
         """
-        default_env_path = Path(__file__).parent.parent.parent / "default.env"
+        cls._load_default_env()
 
-        cls.logger.debug(f"[bold blue]Loading environment variables from {default_env_path}[/bold blue]")
-
-        if default_env_path.exists():
-            load_dotenv(default_env_path)
-            cls.logger.debug(f"[green]Loaded {default_env_path}[/green]")
-
-        if env_file and env_file.exists():
-            load_dotenv(env_file, override=True)
+        if env_file and load_env_file(env_file, override=True):
             cls.logger.debug(f"[green]Loaded {env_file}[/green]")
 
         cls.logger.debug("[bold blue]Loading configuration from environment variables and CLI arguments[/bold blue]")
@@ -172,27 +235,29 @@ class PluginFactoryConfig:
         repo_path = args.repo_path
 
         # Ensure required directories exist before constructing config
-        for dir_path in [config_dir, repo_path]:
-            os.makedirs(dir_path, exist_ok=True)
+        for dir_path in (config_dir, repo_path):
+            _ensure_directory(dir_path)
 
         workspace_path = getattr(args, "workspace_path", None)
 
         source_repo = getattr(args, "source_repo", None)
         source_ref = getattr(args, "source_ref", None)
 
+        registry = _RegistrySettings.from_env()
+
         config = cls(
-            rhdh_cli_version=os.getenv("RHDH_CLI_VERSION", ""),
+            rhdh_cli_version=os.environ.get("RHDH_CLI_VERSION", ""),
             repo_path=repo_path,
             config_dir=config_dir,
             workspace_path=workspace_path or "",
             source_repo=source_repo,
             source_ref=source_ref,
-            registry_url=os.getenv("REGISTRY_URL"),
-            registry_username=os.getenv("REGISTRY_USERNAME"),
-            registry_password=os.getenv("REGISTRY_PASSWORD"),
-            registry_namespace=os.getenv("REGISTRY_NAMESPACE"),
-            registry_insecure=os.getenv("REGISTRY_INSECURE", "false").lower() == "true",
-            registry_auth_file=os.getenv("REGISTRY_AUTH_FILE"),
+            registry_url=registry.url,
+            registry_username=registry.username,
+            registry_password=registry.password,
+            registry_namespace=registry.namespace,
+            registry_insecure=registry.insecure,
+            registry_auth_file=registry.auth_file,
             use_local=args.use_local,
             push_images=push_images,
         )
@@ -215,6 +280,10 @@ class PluginFactoryConfig:
         under the assumption that the host is already authenticated (e.g. via a
         prior ``podman login``).
 
+        A login is also skipped when the same credentials were already used
+        successfully for this registry earlier in the run (e.g. several
+        workspaces pushing to one registry).
+
         Raises:
             ExecutionError: If the buildah login command fails.
         """
@@ -226,14 +295,23 @@ class PluginFactoryConfig:
                 "No registry credentials provided, skipping buildah login (relying on existing host auth)"
             )
             return
+
+        # registry_insecure is part of the key because it changes the login command (--tls-verify=false)
+        login_key = (
+            str(self.registry_username),
+            hashlib.sha256(str(self.registry_password).encode()).hexdigest(),
+            self.registry_insecure,
+        )
+        if self._registry_logins.get(str(self.registry_url)) == login_key:
+            self.logger.debug(f"Already logged in to registry {self.registry_url} with these settings")
+            return
         try:
             cmd = [
                 "buildah",
                 "login",
                 "--username",
                 str(self.registry_username),
-                "--password",
-                str(self.registry_password),
+                "--password-stdin",  # Keeps the password out of the process list
             ]
 
             if self.registry_insecure:
@@ -241,11 +319,20 @@ class PluginFactoryConfig:
 
             cmd.append(str(self.registry_url))
 
-            subprocess.run(cmd, check=True, capture_output=True)
+            # stdout is never read; stderr is kept for the error message
+            subprocess.run(
+                cmd,
+                input=str(self.registry_password),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+            self._registry_logins[str(self.registry_url)] = login_key
             self.logger.info(f"Logged in to registry {self.registry_url} with buildah.")
         except subprocess.CalledProcessError as e:
             raise ExecutionError(
-                f"Failed to login to registry {self.registry_url} with buildah: {e.stderr.decode().strip()}",
+                f"Failed to login to registry {self.registry_url} with buildah: {e.stderr.strip()}",
                 step="buildah login",
                 returncode=e.returncode,
             ) from e
@@ -263,7 +350,7 @@ class PluginFactoryConfig:
         source_file = os.path.join(self.config_dir, SOURCE_CONFIG_FILE)
 
         if not os.path.exists(source_file):
-            if not os.path.exists(self.repo_path) or not os.listdir(self.repo_path):
+            if is_empty_directory(self.repo_path):
                 raise ConfigurationError(
                     f"{SOURCE_CONFIG_FILE} not found at {source_file} and {self.repo_path} is empty. "
                     "Please provide {SOURCE_CONFIG_FILE} to clone a repository, use --source-repo to specify a repository via CLI, "
@@ -342,8 +429,10 @@ class PluginFactoryConfig:
             plugins: dict[str, str] = plugin_cfg.get_plugins()
             if plugins:
                 self.logger.info(f"Generated {PLUGIN_LIST_FILE} with {len(plugins)} plugin(s)")
-                for plugin_path in plugins:
-                    self.logger.info(f"  - {plugin_path}")
+                # Monorepos can yield hundreds of entries; skip formatting them when INFO is off
+                if self.logger.isEnabledFor(INFO):
+                    for plugin_path in plugins:
+                        self.logger.info(f"  - {plugin_path}")
             else:
                 self.logger.warning("No plugins found in workspace")
         except PluginFactoryError:
@@ -424,7 +513,7 @@ class PluginFactoryConfig:
 
         source_file = os.path.join(self.config_dir, SOURCE_CONFIG_FILE)
 
-        if os.path.exists(source_file) and not self.use_local:
+        if not self.use_local and os.path.exists(source_file):
             source_config = SourceConfig.from_file(Path(source_file))
             self.logger.debug(f"Using source config from: {source_config}")
             return source_config
@@ -440,13 +529,18 @@ class PluginFactoryConfig:
 
     def setup_config_directory(self) -> Optional["SourceConfig"]:
         """Setup and validate configuration directory structure."""
+        import yaml
+
         self.logger.info("[bold blue]Setting up configuration directory[/bold blue]")
 
-        os.makedirs(self.config_dir, exist_ok=True)
+        _ensure_directory(self.config_dir)
+        # One directory read instead of a stat() per candidate file
+        with os.scandir(self.config_dir) as it:
+            config_files = {entry.name for entry in it if entry.is_file()}
 
         env_file = os.path.join(self.config_dir, ".env")
-        if os.path.exists(env_file):
-            load_dotenv(env_file, override=True)
+        if ".env" in config_files:
+            load_env_file(env_file, override=True)
             self.logger.debug(f"Loaded .env file: {env_file}")
 
         source_config: SourceConfig | None = self.discover_source_config()
@@ -457,14 +551,13 @@ class PluginFactoryConfig:
 
         plugins_list_file = os.path.join(self.config_dir, PLUGIN_LIST_FILE)
 
-        if os.path.exists(plugins_list_file):
+        if PLUGIN_LIST_FILE in config_files:
             self.logger.info(f"Using plugin list file: {plugins_list_file}")
-            with open(plugins_list_file) as f:
-                plugins_yaml = yaml.dump(yaml.safe_load(f), indent=2)
-            indented_plugins_yaml = "\n".join(
-                "  " + line if line.strip() != "" else line for line in plugins_yaml.splitlines()
-            )
-            self.logger.info(f"Plugins:\n{indented_plugins_yaml}")
+            # The parse/dump round trip only feeds this log message
+            if self.logger.isEnabledFor(INFO):
+                dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                plugins_yaml = yaml.dump(load_yaml(Path(plugins_list_file)), Dumper=dumper, indent=2)
+                self.logger.info(f"Plugins:\n{textwrap.indent(plugins_yaml.rstrip(), '  ')}")
         else:
             self.logger.warning(f"{plugins_list_file} not found, will auto-generate after repository is available")
         return source_config
@@ -489,8 +582,7 @@ class PluginFactoryConfig:
         repo_path = repo_path or self.repo_path
         workspace_path = workspace_path or self.workspace_path
 
-        script_dir = Path(__file__).parent.parent.parent / "scripts"
-        script_path = script_dir / "override-sources.sh"
+        script_path = OVERRIDE_SOURCES_SCRIPT
         STEP_NAME = "apply patches and overlays"
 
         if not script_path.exists():
@@ -501,7 +593,7 @@ class PluginFactoryConfig:
         self.logger.debug(f"Applying patches at repo root: {repo_root}")
         self.logger.debug(f"Applying overlays to workspace: {workspace_full_path}")
         cmd = [
-            str(script_path.absolute()),
+            str(script_path),
             os.path.abspath(config_dir),
             workspace_full_path,
         ]
@@ -547,8 +639,7 @@ class PluginFactoryConfig:
         repo_path = repo_path or self.repo_path
         workspace_path = workspace_path or self.workspace_path
 
-        script_dir = Path(__file__).parent.parent.parent / "scripts"
-        script_path = script_dir / "export-workspace.sh"
+        script_path = EXPORT_WORKSPACE_SCRIPT
         STEP_NAME = "export plugins"
 
         if not script_path.exists():
@@ -560,46 +651,36 @@ class PluginFactoryConfig:
             raise ConfigurationError("No plugins file found")
 
         config_env_file = os.path.join(config_dir, ".env")
-        default_env_file = Path(__file__).parent.parent.parent / "default.env"
-        load_dotenv(default_env_file)
-        env = dict[str, str](os.environ)
+        self._load_default_env()
 
-        if os.path.exists(config_env_file):
-            self.logger.debug(f"Loading script configuration from: {config_env_file}")
-            load_dotenv(config_env_file, override=True)
-            env = dict[str, str](os.environ)
+        if load_env_file(config_env_file, override=True):
+            self.logger.debug(f"Loaded script configuration from: {config_env_file}")
 
         os.makedirs(output_dir, exist_ok=True)
-        env["INPUTS_DESTINATION"] = output_dir
-        env.update(
-            {
-                "INPUTS_SCALPRUM_CONFIG_FILE_NAME": "scalprum-config.json",
-                "INPUTS_SOURCE_OVERLAY_FOLDER_NAME": "overlay",
-                "INPUTS_SOURCE_PATCH_FILE_NAME": "patch",
-                "INPUTS_APP_CONFIG_FILE_NAME": "app-config.dynamic.yaml",
-                "INPUTS_PLUGINS_FILE": os.path.abspath(plugins_list_file),
-                "INPUTS_CLI_PACKAGE": "@red-hat-developer-hub/cli",
-                "INPUTS_PUSH_CONTAINER_IMAGE": "true" if self.push_images else "false",
-                "INPUTS_JANUS_CLI_VERSION": self.rhdh_cli_version,
-                "INPUTS_IMAGE_REPOSITORY_PREFIX": f"{self.registry_url or 'localhost'}/{self.registry_namespace or 'default'}",
-                "INPUTS_DESTINATION": os.path.abspath(output_dir),
-                "INPUTS_CONTAINER_BUILD_TOOL": "buildah",
-            }
-        )
+        # Built in one pass after all .env files have been applied to os.environ
+        env = {
+            **os.environ,
+            **_EXPORT_ENV_TEMPLATE,
+            "INPUTS_PLUGINS_FILE": os.path.abspath(plugins_list_file),
+            "INPUTS_PUSH_CONTAINER_IMAGE": "true" if self.push_images else "false",
+            "INPUTS_JANUS_CLI_VERSION": self.rhdh_cli_version,
+            "INPUTS_IMAGE_REPOSITORY_PREFIX": f"{self.registry_url or 'localhost'}/{self.registry_namespace or 'default'}",
+            "INPUTS_DESTINATION": os.path.abspath(output_dir),
+        }
 
         workspace_full_path = os.path.abspath(os.path.join(repo_path, workspace_path))
         try:
 
             def conditional_stderr_log(line: str) -> None:
                 if "Error" in line:
-                    self.logger.error(line)
+                    self.logger.error(line, extra=PLAIN_OUTPUT)
                 elif "npm warn" in line:
-                    self.logger.warning(line)
+                    self.logger.warning(line, extra=PLAIN_OUTPUT)
                 else:
-                    self.logger.info(line)
+                    self.logger.info(line, extra=PLAIN_OUTPUT)
 
             returncode = run_command_with_streaming(
-                [str(script_path.absolute())],
+                [str(script_path)],
                 self.logger,
                 cwd=Path(workspace_full_path),
                 env=env,
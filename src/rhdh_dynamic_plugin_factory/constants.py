@@ -29,7 +29,14 @@ SKIP_DIRS: set[str] = {
     "__fixtures__",
 }
 
-HOST_LOCKFILE: Path = Path(__file__).parent.parent.parent / "resources" / "rhdh" / "yarn.lock"
+PROJECT_ROOT: Path = Path(__file__).absolute().parent.parent.parent
+SCRIPTS_DIR: Path = PROJECT_ROOT / "scripts"
+OVERRIDE_SOURCES_SCRIPT: Path = SCRIPTS_DIR / "override-sources.sh"
+EXPORT_WORKSPACE_SCRIPT: Path = SCRIPTS_DIR / "export-workspace.sh"
+
+DEFAULT_ENV_FILE: Path = PROJECT_ROOT / "default.env"
+HOST_LOCKFILE: Path = PROJECT_ROOT / "resources" / "rhdh" / "yarn.lock"
+RESOURCE_METADATA_FILE: Path = PROJECT_ROOT / "resources" / "metadata.json"
 
 LOCKFILE_BACKSTAGE_RE: re.Pattern = re.compile(r'"(@backstage/[\w.-]+)@npm:')
 
@@ -4,11 +4,8 @@ Logging utilities for RHDH Plugin Factory.
 
 import logging
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.traceback import install
-
 LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+_LEVEL_NAMES = frozenset(LEVELS)
 
 
 def setup_logging(
@@ -24,11 +21,18 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    # Imported here so that `--help`/`--version` don't pay for loading rich
+    from rich.console import Console
+    from rich.logging import RichHandler
+    from rich.traceback import install
 
     install(show_locals=True)
 
+    level_name = level.upper()
+    log_level = getattr(logging, level_name if level_name in _LEVEL_NAMES else "INFO")
+
     logger = logging.getLogger("rhdh_dynamic_plugin_factory")
-    logger.setLevel(getattr(logging, level.upper() if level.upper() in LEVELS else "INFO"))
+    logger.setLevel(log_level)
     console = Console(stderr=True)
     handler = RichHandler(
         console=console,
@@ -37,7 +41,7 @@ def setup_logging(
         markup=True,
         rich_tracebacks=True,
     )
-    handler.setLevel(getattr(logging, level.upper() if level.upper() in LEVELS else "INFO"))
+    handler.setLevel(log_level)
 
     logger.addHandler(handler)
 
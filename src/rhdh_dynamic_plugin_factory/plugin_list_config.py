@@ -5,15 +5,15 @@ Handles loading, saving, and build-argument computation for plugins-list.yaml fi
 """
 
 import json
+import os
 import re
-from logging import Logger
+from logging import INFO, Logger
 from pathlib import Path
 from typing import ClassVar
 
-import yaml
-
 from . import constants
 from .logger import get_logger
+from .utils import load_yaml
 
 
 class PluginListConfig:
@@ -21,6 +21,8 @@ class PluginListConfig:
 
     logger: ClassVar[Logger] = get_logger("plugin_list")
     _host_packages_cache: ClassVar[set[str] | None] = None
+    # Parsed package.json files, reset at the start of each discovery / build-args pass
+    _package_json_cache: ClassVar[dict[Path, dict]] = {}
 
     def __init__(self, plugins: dict[str, str]):
         """
@@ -35,17 +37,9 @@ class PluginListConfig:
     def from_file(cls, plugin_list_file: Path) -> "PluginListConfig":
         """Load plugin list from YAML file."""
 
-        with open(plugin_list_file) as f:
-            data = yaml.safe_load(f) or {}
-
-        plugins = {}
-        for key, value in data.items():
-            if value is None:
-                plugins[key] = ""
-            else:
-                plugins[key] = str(value)
+        data = load_yaml(plugin_list_file) or {}
 
-        return cls(plugins)
+        return cls({key: "" if value is None else str(value) for key, value in data.items()})
 
     def to_file(self, plugin_list_file: Path) -> None:
         """Save plugin list to YAML file.
@@ -56,12 +50,9 @@ class PluginListConfig:
         Args:
             plugin_list_file: Destination path for the YAML file.
         """
+        content = "".join(f"{path}: {args}\n" if args else f"{path}:\n" for path, args in self.plugins.items())
         with open(plugin_list_file, "w") as f:
-            for path, args in self.plugins.items():
-                if args:
-                    f.write(f"{path}: {args}\n")
-                else:
-                    f.write(f"{path}:\n")
+            f.write(content)
 
     def get_plugins(self) -> dict[str, str]:
         return self.plugins.copy()
@@ -91,30 +82,35 @@ class PluginListConfig:
         """
         original = self.plugins.copy()
         host_packages = self._get_host_packages()
+        self._package_json_cache.clear()
 
-        for plugin_dir in self.plugins:
-            pkg_json_path = workspace_path / plugin_dir / constants.PKG_JSON
-            if not pkg_json_path.is_file():
-                self.logger.warning(
-                    f"Plugin package.json not found in workspace: {plugin_dir} (expected at {pkg_json_path})"
-                )
-                self.plugins[plugin_dir] = ""
-                continue
-
-            role = self._read_backstage_role(pkg_json_path)
-            if not role or role not in constants.VALID_BACKSTAGE_PLUGIN_ROLES:
-                self.logger.warning(
-                    f"Plugin {plugin_dir} has no valid backstage.role — skipping build-arg computation. "
-                    f"Found role: {role}. Valid roles are: {', '.join(constants.VALID_BACKSTAGE_PLUGIN_ROLES)}"
+        try:
+            for plugin_dir in self.plugins:
+                pkg_json_path = workspace_path / plugin_dir / constants.PKG_JSON
+                if not pkg_json_path.is_file():
+                    self.logger.warning(
+                        f"Plugin package.json not found in workspace: {plugin_dir} (expected at {pkg_json_path})"
+                    )
+                    self.plugins[plugin_dir] = ""
+                    continue
+
+                role = self._read_backstage_role(pkg_json_path)
+                if not role or role not in constants.VALID_BACKSTAGE_PLUGIN_ROLES:
+                    self.logger.warning(
+                        f"Plugin {plugin_dir} has no valid backstage.role — skipping build-arg computation. "
+                        f"Found role: {role}. Valid roles are: {', '.join(constants.VALID_BACKSTAGE_PLUGIN_ROLES)}"
+                    )
+                    self.plugins[plugin_dir] = ""
+                    continue
+
+                self.plugins[plugin_dir] = self._compute_plugin_build_args(
+                    workspace_path,
+                    pkg_json_path,
+                    host_packages,
                 )
-                self.plugins[plugin_dir] = ""
-                continue
-
-            self.plugins[plugin_dir] = self._compute_plugin_build_args(
-                workspace_path,
-                pkg_json_path,
-                host_packages,
-            )
+        finally:
+            # The memo only spans this pass; don't hold every parsed manifest for the rest of the process
+            self._package_json_cache.clear()
 
         self._log_build_args_diff(original, self.plugins)
         return self
@@ -126,6 +122,9 @@ class PluginListConfig:
         after: dict[str, str],
     ) -> None:
         """Log a before/after comparison for plugins whose build args changed."""
+        if not cls.logger.isEnabledFor(INFO):
+            return
+
         changed: list[str] = []
         unchanged: list[str] = []
 
@@ -194,18 +193,22 @@ class PluginListConfig:
             A :class:`PluginListConfig` with discovered plugin paths (build args empty).
         """
         plugins: dict[str, str] = {}
+        cls._package_json_cache.clear()
 
-        root_pkg_json = workspace_path / constants.PKG_JSON
-        if root_pkg_json.is_file():
-            role = cls._read_backstage_role(root_pkg_json)
-            if role and role in constants.VALID_BACKSTAGE_PLUGIN_ROLES:
-                plugins["."] = ""
-
-        for pkg_json_path in cls._find_package_jsons(workspace_path):
-            role = cls._read_backstage_role(pkg_json_path)
-            if role and role in constants.VALID_BACKSTAGE_PLUGIN_ROLES:
-                plugin_dir = pkg_json_path.parent.relative_to(workspace_path).as_posix()
-                plugins[plugin_dir] = ""
+        try:
+            root_pkg_json = workspace_path / constants.PKG_JSON
+            if root_pkg_json.is_file():
+                role = cls._read_backstage_role(root_pkg_json)
+                if role and role in constants.VALID_BACKSTAGE_PLUGIN_ROLES:
+                    plugins["."] = ""
+
+            for pkg_json_path in cls._find_package_jsons(workspace_path):
+                role = cls._read_backstage_role(pkg_json_path)
+                if role and role in constants.VALID_BACKSTAGE_PLUGIN_ROLES:
+                    plugin_dir = pkg_json_path.parent.relative_to(workspace_path).as_posix()
+                    plugins[plugin_dir] = ""
+        finally:
+            cls._package_json_cache.clear()
 
         sorted_plugins = dict[str, str](sorted(plugins.items()))
         cls.logger.debug(f"Discovered {len(sorted_plugins)} plugin(s) in {workspace_path}")
@@ -216,20 +219,42 @@ class PluginListConfig:
         """Recursively find package.json files, skipping non-plugin directories."""
         results: list[Path] = []
 
-        for entry in sorted(root.iterdir()):
-            if not entry.is_dir():
-                continue
-            if entry.name in constants.SKIP_DIRS or entry.name.startswith("."):
-                continue
+        # DirEntry.is_dir() is answered from the directory listing without a stat() per entry
+        with os.scandir(root) as it:
+            subdirs = sorted(
+                entry.name
+                for entry in it
+                if entry.is_dir() and entry.name not in constants.SKIP_DIRS and not entry.name.startswith(".")
+            )
 
-            pkg_json = entry / constants.PKG_JSON
+        for name in subdirs:
+            subdir = root / name
+            pkg_json = subdir / constants.PKG_JSON
             if pkg_json.is_file():
                 results.append(pkg_json)
 
-            results.extend(cls._find_package_jsons(entry))
+            results.extend(cls._find_package_jsons(subdir))
 
         return results
 
+    @classmethod
+    def _load_package_json(cls, pkg_json_path: Path) -> dict:
+        """Parse a package.json file, reusing the result within the current pass.
+
+        Backend plugins in one workspace share most of their transitive
+        dependencies, so the same ``node_modules`` manifests are otherwise
+        re-read for every plugin.  Failures are not cached.
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON.
+            OSError: If the file cannot be read.
+        """
+        data = cls._package_json_cache.get(pkg_json_path)
+        if data is None:
+            data = json.loads(pkg_json_path.read_text(encoding="utf-8"))
+            cls._package_json_cache[pkg_json_path] = data
+        return data
+
     @classmethod
     def _read_backstage_role(cls, pkg_json_path: Path) -> str | None:
         """Read the ``backstage.role`` field from a package.json file.
@@ -238,7 +263,7 @@ class PluginListConfig:
             The role string, or *None* if the file cannot be parsed or has no role.
         """
         try:
-            data = json.loads(pkg_json_path.read_text(encoding="utf-8"))
+            data = cls._load_package_json(pkg_json_path)
             role = data.get("backstage", {}).get("role")
             cls.logger.debug(f"Read backstage role from {pkg_json_path}: {role}")
             return str(role) if role is not None else None
@@ -377,7 +402,7 @@ class PluginListConfig:
                 return
 
             try:
-                data = json.loads(pkg_json.read_text(encoding="utf-8"))
+                data = cls._load_package_json(pkg_json)
             except (json.JSONDecodeError, OSError):
                 return
 
@@ -426,7 +451,7 @@ class PluginListConfig:
                 return
 
             try:
-                data = json.loads(pkg_json.read_text(encoding="utf-8"))
+                data = cls._load_package_json(pkg_json)
             except (json.JSONDecodeError, OSError) as e:
                 cls.logger.warning(f"Failed to read {pkg_json}: {e}")
                 return
@@ -466,7 +491,7 @@ class PluginListConfig:
             CLI argument string, or ``""`` if no extra args are needed.
         """
         try:
-            pkg_data = json.loads(pkg_json_path.read_text(encoding="utf-8"))
+            pkg_data = cls._load_package_json(pkg_json_path)
         except (json.JSONDecodeError, OSError):
             return ""
 
@@ -6,6 +6,7 @@ Handles git repository cloning, workspace discovery, and worktree management.
 
 import json
 import os
+import re
 import subprocess
 from dataclasses import dataclass
 from logging import Logger
@@ -15,7 +16,21 @@ from typing import ClassVar
 from .constants import SOURCE_CONFIG_FILE
 from .exceptions import ConfigurationError, ExecutionError, PluginFactoryError
 from .logger import get_logger
-from .utils import prompt_or_clean_directory, repo_dir_name, run_command_with_streaming
+from .utils import clean_directory, prompt_or_clean_directory, repo_dir_name, run_command_with_streaming
+
+# Hex strings that can only name a commit; anything else is treated as a branch or tag
+_FULL_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+_ABBREV_SHA_RE = re.compile(r"^[0-9a-f]{7,39}$")
+
+
+def _history_required() -> bool:
+    """Whether the export needs the repository history, so clones must not be shallow.
+
+    export-workspace.sh skips unchanged workspaces by running
+    ``git merge-base --is-ancestor`` against INPUTS_LAST_PUBLISH_COMMIT, which
+    cannot see past the single commit of a depth-1 clone.
+    """
+    return bool(os.environ.get("INPUTS_LAST_PUBLISH_COMMIT"))
 
 
 @dataclass
@@ -25,6 +40,7 @@ class SourceConfig:
     repo: str
     repo_ref: str | None  # None triggers default branch resolution in __post_init__
     workspace_path: str
+    with_submodules: bool = False
     logger: ClassVar[Logger] = get_logger("source_config")
 
     def __post_init__(self) -> None:
@@ -61,13 +77,18 @@ class SourceConfig:
             repo = data["repo"]
             repo_ref = data.get("repo-ref") or None  # Treat empty string as None
             workspace_path = data.get("workspace-path")
+            with_submodules = data.get("with-submodules", False)
         except KeyError as e:
             raise ConfigurationError(f"Missing required field {e} in {source_file}")
 
+        if not isinstance(with_submodules, bool):
+            raise ConfigurationError(f"with-submodules must be true or false in {source_file}")
+
         config = cls(
             repo=repo,
             repo_ref=repo_ref,
             workspace_path=workspace_path,
+            with_submodules=with_submodules,
         )
 
         return config
@@ -156,9 +177,29 @@ class SourceConfig:
         self.logger.info(f"Reference: {self.repo_ref}")
         self.logger.info(f"Destination directory: {repo_path}")
 
+        try:
+            if clean and self._update_existing_clone(repo_path):
+                if self.with_submodules:
+                    _update_submodules(repo_path, logger)
+                logger.info("[green]Existing repository updated successfully[/green]")
+                return
+        except PluginFactoryError:
+            raise
+        except Exception as e:
+            raise ExecutionError(
+                f"Failed to update existing repository: {e}",
+                step="git fetch/checkout",
+            ) from e
+
         prompt_or_clean_directory(repo_path, clean, self.logger)
 
         try:
+            if self._shallow_clone(repo_path):
+                if self.with_submodules:
+                    _update_submodules(repo_path, logger)
+                logger.info("[green]Repository cloned successfully[/green]")
+                return
+
             cmd = ["git", "clone", self.repo, str(repo_path)]
             returncode = run_command_with_streaming(cmd, logger, stderr_log_func=logger.info)
 
@@ -180,6 +221,9 @@ class SourceConfig:
                     returncode=returncode,
                 )
 
+            if self.with_submodules:
+                _update_submodules(repo_path, logger)
+
             logger.info("[green]Repository cloned successfully[/green]")
 
         except PluginFactoryError:
@@ -190,6 +234,119 @@ class SourceConfig:
                 step="git clone/checkout",
             ) from e
 
+    def _update_existing_clone(self, repo_path: Path) -> bool:
+        """Move an existing clone of the same repository to repo_ref in place.
+
+        Only used with --clean, where the user has already agreed to discard the
+        directory contents: after the update the tree matches a fresh clone
+        (tracked changes reset, untracked and ignored files removed), but only
+        objects that are not already present are downloaded.
+
+        Returns:
+            True if repo_path now has repo_ref checked out. False if repo_path is
+            not a clone of this repository, the ref cannot be fetched by name, the
+            export needs full history (see :func:`_history_required`), or any git
+            step failed; the caller then falls back to clean + clone.
+        """
+        logger = get_logger("cli")
+        ref = str(self.repo_ref)
+
+        if not (repo_path / ".git").exists() or _ABBREV_SHA_RE.match(ref) or _history_required():
+            return False
+
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0 or result.stdout.strip() != self.repo:
+            return False
+
+        logger.info(f"[cyan]Updating existing clone at {repo_path} to ref: {ref}[/cyan]")
+        commands = [
+            ["git", "fetch", "--depth=1", "origin", ref],
+            ["git", "checkout", "--quiet", "--force", "--detach", "FETCH_HEAD"],
+            ["git", "clean", "-ffdxq"],
+        ]
+        for cmd in commands:
+            returncode = run_command_with_streaming(cmd, logger, cwd=repo_path, stderr_log_func=logger.info)
+            if returncode != 0:
+                self.logger.warning(
+                    f"[yellow]Updating the existing clone failed (exit code {returncode}), re-cloning instead[/yellow]"
+                )
+                return False
+
+        return True
+
+    def _shallow_clone(self, repo_path: Path) -> bool:
+        """Fetch only the commit at repo_ref into repo_path, without history.
+
+        Branches and tags (including refs/heads/ and refs/tags/ refs) are cloned
+        with ``--depth=1 --single-branch --branch``. A full commit SHA is fetched
+        directly with ``git fetch --depth=1 origin <sha>``. Abbreviated SHAs and
+        other revision expressions cannot be fetched shallowly and are left to
+        the full clone, as is every ref when INPUTS_LAST_PUBLISH_COMMIT is set
+        (see :func:`_history_required`).
+
+        Returns:
+            True if the ref is checked out in repo_path. False if the caller should
+            fall back to a full clone; repo_path has been emptied in that case.
+        """
+        logger = get_logger("cli")
+        ref = str(self.repo_ref)
+
+        if _history_required():
+            logger.info("[cyan]INPUTS_LAST_PUBLISH_COMMIT is set, cloning full history[/cyan]")
+            return False
+
+        if _FULL_SHA_RE.match(ref):
+            commands = [
+                ["git", "init", "--quiet"],
+                ["git", "remote", "add", "origin", self.repo],
+                ["git", "fetch", "--depth=1", "origin", ref],
+                ["git", "checkout", "--quiet", "--detach", "FETCH_HEAD"],
+            ]
+        elif _ABBREV_SHA_RE.match(ref):
+            return False
+        else:
+            branch = ref.removeprefix("refs/heads/").removeprefix("refs/tags/")
+            commands = [["git", "clone", "--depth=1", "--single-branch", "--branch", branch, self.repo, "."]]
+
+        logger.info(f"[cyan]Shallow cloning ref: {ref}[/cyan]")
+        for cmd in commands:
+            returncode = run_command_with_streaming(cmd, logger, cwd=repo_path, stderr_log_func=logger.info)
+            if returncode != 0:
+                self.logger.warning(
+                    f"[yellow]Shallow clone of {ref} failed (exit code {returncode}), falling back to a full clone[/yellow]"
+                )
+                clean_directory(repo_path)
+                return False
+
+        return True
+
+
+def _update_submodules(repo_path: Path, logger: Logger) -> None:
+    """Check out the submodules recorded at the current commit, fetching them in parallel.
+
+    Run after the superproject ref is checked out, so submodules always match that
+    ref regardless of how the superproject was cloned.
+
+    Raises:
+        ExecutionError: If the submodule update fails.
+    """
+    jobs = os.cpu_count() or 4
+    logger.info(f"[cyan]Updating submodules ({jobs} parallel jobs)[/cyan]")
+    cmd = ["git", "submodule", "update", "--init", "--recursive", f"--jobs={jobs}"]
+    returncode = run_command_with_streaming(cmd, logger, cwd=repo_path, stderr_log_func=logger.info)
+
+    if returncode != 0:
+        raise ExecutionError(
+            f"Failed to update submodules in {repo_path} (exit code {returncode})",
+            step="git submodule update",
+            returncode=returncode,
+        )
+
 
 @dataclass
 class WorkspaceInfo:
@@ -233,16 +390,17 @@ def discover_workspaces(config_dir: Path) -> list["WorkspaceInfo"]:
     if not config_dir.is_dir():
         return workspaces
 
-    for entry in sorted(config_dir.iterdir()):
-        if not entry.is_dir():
-            continue
+    # scandir entries carry their file type, so is_dir() needs no extra stat()
+    with os.scandir(config_dir) as it:
+        subdirs = sorted(entry.name for entry in it if entry.is_dir())
 
+    for workspace_name in subdirs:
+        entry = config_dir / workspace_name
         source_file = entry / SOURCE_CONFIG_FILE
         if not source_file.exists():
-            logger.debug(f"Skipping {entry.name}/ — no {SOURCE_CONFIG_FILE}")
+            logger.debug(f"Skipping {workspace_name}/ — no {SOURCE_CONFIG_FILE}")
             continue
 
-        workspace_name = entry.name
         logger.debug(f"Discovered workspace: {workspace_name}")
 
         source_config = SourceConfig.from_file(source_file)
@@ -340,4 +498,7 @@ def clone_workspaces_with_worktrees(
                     returncode=returncode,
                 )
 
+            if ws.source_config.with_submodules:
+                _update_submodules(worktree_path, logger)
+
             logger.info(f"[green]  Worktree created for '{ws.name}' at {worktree_path}[/green]")
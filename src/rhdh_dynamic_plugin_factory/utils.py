@@ -2,37 +2,120 @@
 Utility functions for RHDH Plugin Factory.
 """
 
+import codecs
+import functools
+import os
+import selectors
 import shutil
 import subprocess
 import tempfile
-import threading
-from collections.abc import Callable
-from logging import Logger
+from collections.abc import Callable, Mapping
+from logging import INFO, Logger, getLevelName
 from pathlib import Path
-from typing import IO
+from typing import IO, Any
 
 from .exceptions import ExecutionError, PluginFactoryError
 
+_READ_CHUNK_SIZE = 65536
 
-def _stream_output(pipe: IO[str], log_func: Callable[[str], None]) -> None:
+# Logging `extra` for subprocess output: tells RichHandler to print the line
+# verbatim, skipping markup parsing and highlighting. Besides being cheaper
+# per line, this keeps tool output containing "[...]" from being mangled or
+# raising a MarkupError.
+PLAIN_OUTPUT: Mapping[str, object] = {"markup": False, "highlighter": None}
+
+
+def _split_output_lines(text: str) -> list[str]:
+    """Split decoded output into lines, treating \r\n, \r and \n as line breaks."""
+    return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+
+def _plain_output_log_func(log_func: Callable[[str], None]) -> Callable[[str], None] | None:
+    """Make a bound Logger method log its lines with PLAIN_OUTPUT; return other callables unchanged.
+
+    Returns None when log_func is a level method (info, warning, ...) of a
+    Logger that has that level disabled, so the caller can skip decoding the
+    output altogether.
     """
-    Stream output from a pipe to a logging function.
+    logger_instance = getattr(log_func, "__self__", None)
+    if isinstance(logger_instance, Logger):
+        level = getLevelName(log_func.__name__.upper())
+        if isinstance(level, int) and not logger_instance.isEnabledFor(level):
+            return None
+        # Go through the Logger itself: log_func's Callable[[str], None] type hides `extra`
+        return functools.partial(getattr(logger_instance, log_func.__name__), extra=PLAIN_OUTPUT)
+    return log_func
+
+
+class _LineDecoder:
+    """Incrementally decode a byte stream and log each complete line."""
+
+    def __init__(self, log_func: Callable[[str], None]) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._log_func = log_func
+
+    def feed(self, chunk: bytes) -> None:
+        """Decode a chunk and log every line it completes."""
+        text = self._pending + self._decoder.decode(chunk)
+        # Hold back a trailing \r in case its \n arrives with the next chunk
+        carry = ""
+        if text.endswith("\r"):
+            text, carry = text[:-1], "\r"
+        *lines, pending = _split_output_lines(text)
+        self._pending = pending + carry
+        for line in lines:
+            self._log_func(line.rstrip())
+
+    def flush(self) -> None:
+        """Log whatever is left once the stream has ended."""
+        tail = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        if tail:
+            for line in _split_output_lines(tail.rstrip("\r\n")):
+                self._log_func(line.rstrip())
+
+
+def _stream_outputs(streams: dict[IO[bytes], Callable[[str], None] | None]) -> None:
+    """
+    Stream output from several pipes to their logging functions until all are closed.
+
+    All pipes are multiplexed with a selector on the calling thread instead of
+    one reader thread per pipe. Each pipe is drained with os.read() in large
+    chunks rather than line by line; each chunk is decoded once and split into
+    lines in Python, so chatty commands (e.g. yarn install) cost one read
+    syscall per chunk instead of per line.
 
     Args:
-        pipe: A file-like object to read from (e.g., process.stdout or process.stderr)
-        log_func: A callable that logs each line (e.g., logger.info or logger.error)
+        streams: Binary pipes (e.g. process.stdout, process.stderr) mapped to the
+            callable that logs each of their lines (e.g. logger.info), or to
+            None to drain the pipe without decoding it
     """
     try:
-        for line in pipe:
-            log_func(line.rstrip())
+        with selectors.DefaultSelector() as selector:
+            for pipe, log_func in streams.items():
+                decoder = _LineDecoder(log_func) if log_func is not None else None
+                selector.register(pipe, selectors.EVENT_READ, decoder)
+
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, _READ_CHUNK_SIZE)
+                    if chunk:
+                        if key.data is not None:
+                            key.data.feed(chunk)
+                    else:
+                        if key.data is not None:
+                            key.data.flush()
+                        selector.unregister(key.fileobj)
     finally:
-        pipe.close()
+        for pipe in streams:
+            pipe.close()
 
 
 def run_command_with_streaming(
     cmd: list[str],
     logger_instance: Logger,
-    cwd: Path | None = None,
+    cwd: str | Path | None = None,
     env: dict[str, str] | None = None,
     stderr_log_func: Callable[[str], None] | None = None,
 ) -> int:
@@ -61,21 +144,22 @@ def run_command_with_streaming(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
         cwd=cwd,
         env=env,
     )
 
-    # Create threads to read stdout and stderr concurrently
-    stdout_thread = threading.Thread(target=_stream_output, args=(process.stdout, logger_instance.info))
-    stderr_thread = threading.Thread(target=_stream_output, args=(process.stderr, stderr_log_func))
+    # Output for a disabled level (e.g. stdout when running with --log-level WARNING)
+    # is still drained, but never decoded or split into lines
+    stdout_log_func = (
+        functools.partial(logger_instance.info, extra=PLAIN_OUTPUT) if logger_instance.isEnabledFor(INFO) else None
+    )
+    stderr_log_func = _plain_output_log_func(stderr_log_func)
 
-    stdout_thread.start()
-    stderr_thread.start()
+    # Both pipes were requested above, so Popen always creates them
+    assert process.stdout is not None and process.stderr is not None
 
-    stdout_thread.join()
-    stderr_thread.join()
+    # Read stdout and stderr concurrently so neither pipe can fill up and block the process
+    _stream_outputs({process.stdout: stdout_log_func, process.stderr: stderr_log_func})
 
     process.wait()
 
@@ -129,6 +213,14 @@ def collect_build_logs(logger: Logger, tmp_dir: Path | None = None, *, has_error
             logger.warning(f"  {line}")
 
 
+def _read_lines(path: Path) -> list[str]:
+    """Return the non-blank lines of a text file, or an empty list if it does not exist."""
+    try:
+        return [line for line in path.read_text().splitlines() if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
 def display_export_results(workspace_path: Path, logger: Logger) -> bool:
     """Display results from export script output files.
 
@@ -139,24 +231,18 @@ def display_export_results(workspace_path: Path, logger: Logger) -> bool:
     Returns:
         True if there were any failed exports, False otherwise.
     """
-    failed_file = workspace_path / "failed-exports-output"
-    published_file = workspace_path / "published-exports-output"
-    has_failures = False
+    failed_exports = _read_lines(workspace_path / "failed-exports-output")
+    published_exports = _read_lines(workspace_path / "published-exports-output")
 
-    if failed_file.exists():
-        failed_exports = failed_file.read_text().strip().split("\n") if failed_file.stat().st_size > 0 else []
-        if failed_exports and failed_exports[0]:
-            has_failures = True
-            logger.error(f"Failed exports ({len(failed_exports)}): {', '.join(failed_exports)}")
+    if failed_exports:
+        logger.error(f"Failed exports ({len(failed_exports)}): {', '.join(failed_exports)}")
 
-    if published_file.exists():
-        published_exports = published_file.read_text().strip().split("\n") if published_file.stat().st_size > 0 else []
-        if published_exports and published_exports[0]:
-            logger.info(f"[green]Published images ({len(published_exports)}):[/green]")
-            for image in published_exports:
-                logger.info(f"  - {image}")
+    if published_exports:
+        logger.info(f"[green]Published images ({len(published_exports)}):[/green]")
+        for image in published_exports:
+            logger.info(f"  - {image}")
 
-    return has_failures
+    return bool(failed_exports)
 
 
 def clean_directory(directory: Path) -> None:
@@ -182,6 +268,25 @@ def clean_directory(directory: Path) -> None:
         ) from e
 
 
+def is_empty_directory(path: str | Path) -> bool:
+    """Check whether a directory is empty or missing.
+
+    Reads at most one entry instead of listing the whole directory, which
+    matters for repository checkouts with large top-level trees.
+
+    Args:
+        path: Directory to check.
+
+    Returns:
+        True if the directory has no entries or does not exist.
+    """
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
+        return True
+
+
 def prompt_or_clean_directory(path: Path, clean: bool, logger: Logger) -> None:
     """Clears contents of a non-empty directory by automatically or by prompting the user.
 
@@ -196,7 +301,7 @@ def prompt_or_clean_directory(path: Path, clean: bool, logger: Logger) -> None:
         PluginFactoryError: If the user declines to clean.
         ExecutionError: If the directory or files cannot be removed. (Thrown from clean_directory)
     """
-    if not path.exists() or not any(path.iterdir()):
+    if is_empty_directory(path):
         return
 
     logger.warning(f"[yellow]Source directory {path} is not empty[/yellow]")
@@ -216,6 +321,48 @@ def prompt_or_clean_directory(path: Path, clean: bool, logger: Logger) -> None:
             clean_directory(path)
 
 
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file using the libyaml-backed safe loader when available.
+
+    Falls back to the pure-Python ``SafeLoader`` if PyYAML was built
+    without libyaml bindings.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        The deserialized YAML document (``None`` for an empty file).
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        return yaml.load(f, Loader=loader)
+
+
+def load_env_file(env_file: str | Path, override: bool = False) -> bool:
+    """Load a .env file into os.environ if it exists.
+
+    The file is parsed on every call on purpose: values may interpolate
+    ${VAR} references against the current environment, and callers reload
+    files after resetting os.environ to re-establish precedence.
+
+    Args:
+        env_file: Path to the .env file.
+        override: Whether values from the file replace variables already set.
+
+    Returns:
+        True if the file exists and was loaded, False otherwise.
+    """
+    if not Path(env_file).exists():
+        return False
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_file, override=override)
+    return True
+
+
 def repo_dir_name(repo_url: str) -> str:
     """Derive a directory name from a git repository URL.
 
@@ -14,8 +14,10 @@ from src.rhdh_dynamic_plugin_factory.plugin_list_config import PluginListConfig
 
 
 @pytest.fixture(autouse=True)
-def _clear_host_packages_cache():
+def _clear_class_caches():
     PluginListConfig._host_packages_cache = None
+    PluginListConfig._package_json_cache.clear()
+    PluginFactoryConfig._registry_logins.clear()
 
 
 def _write_source_json(directory: Path, repo: str, repo_ref: str, workspace_path: str = ".") -> None:
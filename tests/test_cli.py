@@ -4,9 +4,49 @@ Unit tests for CLI argument parsing.
 Tests the argument parser to ensure all arguments are correctly defined and parsed.
 """
 
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
-from src.rhdh_dynamic_plugin_factory.cli import _run, create_parser
-from src.rhdh_dynamic_plugin_factory.exceptions import ConfigurationError
+from src.rhdh_dynamic_plugin_factory.__version__ import __version__
+from src.rhdh_dynamic_plugin_factory.cli import _run, create_parser, install_dependencies, main
+from src.rhdh_dynamic_plugin_factory.exceptions import ConfigurationError, ExecutionError
+
+
+class TestCreateParserVersionArgument:
+    """Tests for the --version argument in create_parser()."""
+
+    def test_version_prints_and_exits(self, capsys):
+        """Test that --version prints the version string to stdout and exits successfully."""
+        parser = create_parser()
+
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(["--version"])
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.startswith(f"rhdh-dynamic-plugin-factory:  {__version__}\n")
+
+    def test_main_version_fast_path_skips_parser(self, capsys):
+        """Test that main() answers a bare --version without building the argument parser."""
+        with patch("sys.argv", ["rhdh-dynamic-plugin-factory", "--version"]):
+            with patch("src.rhdh_dynamic_plugin_factory.cli.create_parser") as mock_create_parser:
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+
+        assert exc_info.value.code == 0
+        mock_create_parser.assert_not_called()
+        assert capsys.readouterr().out.startswith(f"rhdh-dynamic-plugin-factory:  {__version__}\n")
+
+    def test_version_string_not_built_without_flag(self):
+        """Test that building and using the parser does not compute the version string."""
+        with patch("src.rhdh_dynamic_plugin_factory.cli._build_version_string") as mock_build:
+            create_parser().parse_args([])
+
+        mock_build.assert_not_called()
 
 
 class TestCreateParserCleanArgument:
@@ -152,3 +192,184 @@ class TestRunSourceArgValidation:
 
         with pytest.raises(ConfigurationError, match="--source-ref requires --source-repo"):
             _run(mock_args)
+
+
+class TestInstallDependencies:
+    """Tests for install_dependencies()."""
+
+    def _run_install(self, tmp_path, level=logging.INFO, returncode=0, force_install=False, yarn_path=None):
+        with (
+            patch.dict(os.environ),
+            patch("src.rhdh_dynamic_plugin_factory.cli.shutil.which", return_value=yarn_path),
+            patch("src.rhdh_dynamic_plugin_factory.cli.run_command_with_streaming") as mock_run_cmd,
+            patch("src.rhdh_dynamic_plugin_factory.cli.collect_build_logs"),
+            patch("src.rhdh_dynamic_plugin_factory.cli.logger") as mock_logger,
+        ):
+            mock_logger.isEnabledFor.side_effect = lambda lvl: lvl >= level
+            mock_run_cmd.return_value = returncode
+            install_dependencies(tmp_path, force_install=force_install)
+        return [call[0][0] for call in mock_run_cmd.call_args_list]
+
+    def test_runs_install_steps_in_order(self, tmp_path):
+        """Test that corepack, yarn install and yarn tsc run in order without diagnostic commands."""
+        cmds = self._run_install(tmp_path)
+
+        assert cmds == [
+            ["corepack", "enable"],
+            ["yarn", "install", "--immutable"],
+            ["yarn", "tsc"],
+        ]
+
+    def test_yarn_version_probe_only_at_debug(self, tmp_path):
+        """Test that `yarn --version` is only run when debug logging is enabled."""
+        cmds = self._run_install(tmp_path, level=logging.DEBUG)
+
+        assert ["yarn", "--version"] in cmds
+        assert ["pwd"] not in cmds
+
+    def test_importing_cli_disables_corepack_prompt_by_default(self):
+        """Test that importing the CLI sets COREPACK_ENABLE_DOWNLOAD_PROMPT=0 when it is unset."""
+        env = {k: v for k, v in os.environ.items() if k != "COREPACK_ENABLE_DOWNLOAD_PROMPT"}
+        code = "import os, src.rhdh_dynamic_plugin_factory.cli; print(os.environ['COREPACK_ENABLE_DOWNLOAD_PROMPT'])"
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parent.parent, env=env, capture_output=True, text=True
+        )
+
+        assert result.stdout.strip() == "0"
+
+    def test_commands_inherit_user_corepack_prompt_setting(self, tmp_path, monkeypatch):
+        """Test that commands inherit a user-set COREPACK_ENABLE_DOWNLOAD_PROMPT unchanged from os.environ."""
+        monkeypatch.setenv("COREPACK_ENABLE_DOWNLOAD_PROMPT", "1")
+        seen = []
+
+        def record_env(cmd, logger, cwd=None, env=None):
+            seen.append((env, os.environ.get("COREPACK_ENABLE_DOWNLOAD_PROMPT")))
+            return 0
+
+        with (
+            patch("src.rhdh_dynamic_plugin_factory.cli.shutil.which", return_value=None),
+            patch("src.rhdh_dynamic_plugin_factory.cli.run_command_with_streaming", side_effect=record_env),
+            patch("src.rhdh_dynamic_plugin_factory.cli.collect_build_logs"),
+            patch("src.rhdh_dynamic_plugin_factory.cli.logger"),
+        ):
+            install_dependencies(tmp_path)
+
+        assert seen and all(entry == (None, "1") for entry in seen)
+
+    def test_failed_step_raises_execution_error(self, tmp_path):
+        """Test that a non-zero exit code raises ExecutionError with the step's return code."""
+        with pytest.raises(ExecutionError, match="Enabling corepack failed") as exc_info:
+            self._run_install(tmp_path, returncode=2)
+
+        assert exc_info.value.returncode == 2
+
+    @staticmethod
+    def _make_installed_workspace(tmp_path):
+        """Create a workspace whose install state is newer than its manifests."""
+        (tmp_path / "package.json").write_text("{}")
+        (tmp_path / "yarn.lock").write_text("")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / ".yarn").mkdir()
+        install_state = tmp_path / ".yarn" / "install-state.gz"
+        install_state.write_bytes(b"")
+        os.utime(tmp_path / "package.json", ns=(1_000_000_000, 1_000_000_000))
+        os.utime(tmp_path / "yarn.lock", ns=(1_000_000_000, 1_000_000_000))
+        os.utime(install_state, ns=(2_000_000_000, 2_000_000_000))
+        return install_state
+
+    def test_skips_yarn_install_when_up_to_date(self, tmp_path):
+        """Test that yarn install is skipped when the install state is newer than yarn.lock and package.json."""
+        self._make_installed_workspace(tmp_path)
+
+        cmds = self._run_install(tmp_path)
+
+        assert cmds == [["corepack", "enable"], ["yarn", "tsc"]]
+
+    def test_runs_yarn_install_when_lockfile_changed(self, tmp_path):
+        """Test that yarn install runs when yarn.lock is newer than the install state."""
+        self._make_installed_workspace(tmp_path)
+        os.utime(tmp_path / "yarn.lock", ns=(3_000_000_000, 3_000_000_000))
+
+        cmds = self._run_install(tmp_path)
+
+        assert ["yarn", "install", "--immutable"] in cmds
+
+    def test_runs_yarn_install_when_nested_package_json_changed(self, tmp_path):
+        """Test that yarn install runs when a workspace package.json (e.g. edited by a patch) is newer."""
+        self._make_installed_workspace(tmp_path)
+        plugin_pkg = tmp_path / "plugins" / "todo" / "package.json"
+        plugin_pkg.parent.mkdir(parents=True)
+        plugin_pkg.write_text("{}")
+        os.utime(plugin_pkg, ns=(3_000_000_000, 3_000_000_000))
+
+        cmds = self._run_install(tmp_path)
+
+        assert ["yarn", "install", "--immutable"] in cmds
+
+    def test_runs_yarn_install_when_yarnrc_changed(self, tmp_path):
+        """Test that yarn install runs when .yarnrc.yml is newer than the install state."""
+        self._make_installed_workspace(tmp_path)
+        yarnrc = tmp_path / ".yarnrc.yml"
+        yarnrc.write_text("nodeLinker: node-modules\n")
+        os.utime(yarnrc, ns=(3_000_000_000, 3_000_000_000))
+
+        cmds = self._run_install(tmp_path)
+
+        assert ["yarn", "install", "--immutable"] in cmds
+
+    def test_ignores_package_json_in_node_modules_and_build_output(self, tmp_path):
+        """Test that package.json files under node_modules and dist do not force a reinstall."""
+        self._make_installed_workspace(tmp_path)
+        for pkg in (
+            tmp_path / "node_modules" / "dep" / "package.json",
+            tmp_path / "plugins" / "todo" / "dist" / "package.json",
+        ):
+            pkg.parent.mkdir(parents=True)
+            pkg.write_text("{}")
+            os.utime(pkg, ns=(3_000_000_000, 3_000_000_000))
+
+        cmds = self._run_install(tmp_path)
+
+        assert ["yarn", "install", "--immutable"] not in cmds
+
+    def test_skips_corepack_enable_when_yarn_is_corepack_shim(self, tmp_path):
+        """Test that corepack enable is skipped when yarn already links to corepack's yarn.js."""
+        shim_target = tmp_path / "lib" / "node_modules" / "corepack" / "dist" / "yarn.js"
+        shim_target.parent.mkdir(parents=True)
+        shim_target.write_text("")
+        yarn_link = tmp_path / "bin" / "yarn"
+        yarn_link.parent.mkdir()
+        yarn_link.symlink_to(shim_target)
+
+        cmds = self._run_install(tmp_path, yarn_path=str(yarn_link))
+
+        assert ["corepack", "enable"] not in cmds
+        assert cmds[-1] == ["yarn", "tsc"]
+
+    def test_runs_corepack_enable_for_non_corepack_yarn(self, tmp_path):
+        """Test that corepack enable still runs when yarn on PATH is not the corepack shim."""
+        yarn_bin = tmp_path / "node_modules" / "yarn" / "bin" / "yarn.js"
+        yarn_bin.parent.mkdir(parents=True)
+        yarn_bin.write_text("")
+
+        cmds = self._run_install(tmp_path, yarn_path=str(yarn_bin))
+
+        assert cmds[0] == ["corepack", "enable"]
+
+    def test_runs_yarn_install_without_node_modules(self, tmp_path):
+        """Test that yarn install runs when node_modules is missing despite a fresh install state."""
+        self._make_installed_workspace(tmp_path)
+        (tmp_path / "node_modules").rmdir()
+
+        cmds = self._run_install(tmp_path)
+
+        assert ["yarn", "install", "--immutable"] in cmds
+
+    def test_force_install_ignores_install_state(self, tmp_path):
+        """Test that force_install runs yarn install even when dependencies are up to date."""
+        self._make_installed_workspace(tmp_path)
+
+        cmds = self._run_install(tmp_path, force_install=True)
+
+        assert ["yarn", "install", "--immutable"] in cmds
@@ -29,7 +29,7 @@ class TestExportPlugins:
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
                     with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
-                        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                        with patch("dotenv.load_dotenv"):
                             mock_run_cmd.return_value = 0
                             mock_display.return_value = False
 
@@ -52,6 +52,28 @@ class TestExportPlugins:
                             assert "INPUTS_PLUGINS_FILE" in env
                             assert "INPUTS_PUSH_CONTAINER_IMAGE" in env
 
+    def test_export_plugins_skips_default_env_when_already_set(self, make_config, setup_test_env, monkeypatch):
+        """Test that export_plugins only reloads the config .env when default.env values are already set."""
+        monkeypatch.setenv("RHDH_CLI_VERSION", "1.7.2")
+        config = make_config(registry_url="quay.io", registry_namespace="test-namespace")
+
+        output_dir = str(setup_test_env["tmp_path"] / "output")
+
+        with patch.object(Path, "exists", return_value=True):
+            with patch("os.path.exists", return_value=True):
+                with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
+                    with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
+                        with patch("src.rhdh_dynamic_plugin_factory.config.load_env_file") as mock_load_env_file:
+                            mock_run_cmd.return_value = 0
+                            mock_display.return_value = False
+                            mock_load_env_file.return_value = False
+
+                            config.export_plugins(output_dir)
+
+                            mock_load_env_file.assert_called_once_with(
+                                os.path.join(config.config_dir, ".env"), override=True
+                            )
+
     def test_export_plugins_environment_variables_no_push(self, make_config, setup_test_env):
         """Test that environment variables are correctly set when push_images is False."""
         config = make_config(registry_url="quay.io", registry_namespace="test-namespace")
@@ -63,7 +85,7 @@ class TestExportPlugins:
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
                     with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
-                        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                        with patch("dotenv.load_dotenv"):
                             mock_run_cmd.return_value = 0
                             mock_display.return_value = False
 
@@ -99,7 +121,7 @@ class TestExportPlugins:
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
                     with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
-                        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                        with patch("dotenv.load_dotenv"):
                             mock_run_cmd.return_value = 0
                             mock_display.return_value = False
 
@@ -118,7 +140,7 @@ class TestExportPlugins:
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
                     with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
-                        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                        with patch("dotenv.load_dotenv"):
                             mock_run_cmd.return_value = 0
                             mock_display.return_value = False
 
@@ -169,7 +191,7 @@ class TestExportPlugins:
         with patch.object(Path, "exists", return_value=True):
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
-                    with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                    with patch("dotenv.load_dotenv"):
                         mock_run_cmd.return_value = 1
 
                         with pytest.raises(ExecutionError, match="exit code 1"):
@@ -185,7 +207,7 @@ class TestExportPlugins:
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
                     with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
-                        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                        with patch("dotenv.load_dotenv"):
                             mock_run_cmd.return_value = 0
                             mock_display.return_value = True
 
@@ -201,7 +223,7 @@ class TestExportPlugins:
         with patch.object(Path, "exists", return_value=True):
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
-                    with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv"):
+                    with patch("dotenv.load_dotenv"):
                         mock_run_cmd.side_effect = Exception("Test exception")
 
                         with pytest.raises(
@@ -223,7 +245,7 @@ class TestExportPlugins:
             with patch("os.path.exists", return_value=True):
                 with patch("src.rhdh_dynamic_plugin_factory.config.run_command_with_streaming") as mock_run_cmd:
                     with patch("src.rhdh_dynamic_plugin_factory.config.display_export_results") as mock_display:
-                        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv") as mock_load_dotenv:
+                        with patch("dotenv.load_dotenv") as mock_load_dotenv:
                             with patch.object(config, "logger") as mock_logger:
                                 mock_run_cmd.return_value = 0
                                 mock_display.return_value = False
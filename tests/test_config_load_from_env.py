@@ -10,7 +10,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from src.rhdh_dynamic_plugin_factory.config import PluginFactoryConfig
+from src.rhdh_dynamic_plugin_factory.config import _DEFAULT_ENV_KEYS, PluginFactoryConfig
 from src.rhdh_dynamic_plugin_factory.exceptions import ConfigurationError
 
 
@@ -91,10 +91,10 @@ class TestPluginFactoryConfigLoadFromEnv:
         mock_args.workspace_path = "."
 
         # Load with custom env file (should be loaded and override defaults)
-        with patch("src.rhdh_dynamic_plugin_factory.config.load_dotenv") as mock_load_dotenv:
-            # Let the actual load_dotenv run but track it
-            from dotenv import load_dotenv as real_load_dotenv
+        from dotenv import load_dotenv as real_load_dotenv
 
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            # Let the actual load_dotenv run but track it
             mock_load_dotenv.side_effect = real_load_dotenv
 
             # Actually set the env vars for the test
@@ -112,6 +112,26 @@ class TestPluginFactoryConfigLoadFromEnv:
         assert config.registry_url == "quay.io"
         assert config.registry_namespace == "test-namespace"
 
+    def test_default_env_keys_match_default_env_file(self):
+        """Test that _DEFAULT_ENV_KEYS lists exactly the variables default.env assigns."""
+        from dotenv import dotenv_values
+        from src.rhdh_dynamic_plugin_factory.constants import DEFAULT_ENV_FILE
+
+        assert set(dotenv_values(DEFAULT_ENV_FILE)) == set(_DEFAULT_ENV_KEYS)
+
+    def test_load_from_env_skips_default_env_when_already_set(self, mock_args, setup_test_env, clean_env):
+        """Test that default.env is not parsed when all of its variables are already in the environment."""
+        clean_env.setenv("RHDH_CLI_VERSION", "1.7.2")
+        mock_args.config_dir = setup_test_env["config_dir"]
+        mock_args.repo_path = setup_test_env["source_dir"]
+        mock_args.workspace_path = "."
+
+        with patch("src.rhdh_dynamic_plugin_factory.config.load_env_file") as mock_load_env_file:
+            config = PluginFactoryConfig.load_from_env(mock_args)
+
+        mock_load_env_file.assert_not_called()
+        assert config.rhdh_cli_version == "1.7.2"
+
     def test_load_from_env_directory_creation(self, mock_args, tmp_path, monkeypatch):
         """Test that config_dir and repo_path directories are created."""
         monkeypatch.setenv("RHDH_CLI_VERSION", "1.7.2")
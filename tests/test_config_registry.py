@@ -183,13 +183,16 @@ class TestBuildahLogin:
                     "login",
                     "--username",
                     "test-user",
-                    "--password",
-                    "test-password",
+                    "--password-stdin",
                     "quay.io",
                 ]
                 assert call_args[0][0] == expected_cmd
                 assert call_args[1]["check"] is True
-                assert call_args[1]["capture_output"] is True
+                assert call_args[1]["stdout"] is subprocess.DEVNULL
+                assert call_args[1]["stderr"] is subprocess.PIPE
+                assert call_args[1]["text"] is True
+                assert call_args[1]["input"] == "test-password"
+                assert "test-password" not in call_args[0][0]
 
                 mock_logger.info.assert_called_with("Logged in to registry quay.io with buildah.")
 
@@ -206,16 +209,101 @@ class TestBuildahLogin:
 
         with patch("subprocess.run") as mock_run:
             mock_error = subprocess.CalledProcessError(
-                returncode=1, cmd=["buildah", "login"], stderr=b"Authentication failed"
+                returncode=1, cmd=["buildah", "login"], stderr="Authentication failed\n"
             )
             mock_run.side_effect = mock_error
 
             with pytest.raises(ExecutionError, match="Failed to login to registry quay.io") as exc_info:
                 config._buildah_login()
 
+            assert str(exc_info.value).endswith("Authentication failed")
+
             assert exc_info.value.step == "buildah login"
             assert exc_info.value.returncode == 1
 
+    def test_repeated_login_with_same_credentials_is_skipped(self, make_config):
+        """A second login to the same registry with unchanged credentials does not rerun buildah."""
+        config = make_config(
+            push_images=True,
+            registry_url="quay.io",
+            registry_namespace="test-namespace",
+            registry_username="test-user",
+            registry_password="test-password",
+        )
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            config._buildah_login()
+            config._buildah_login()
+
+            mock_run.assert_called_once()
+
+    def test_login_reruns_when_credentials_change(self, make_config):
+        """Switching credentials for a registry logs in again, and switching back does too."""
+        config = make_config(
+            push_images=True,
+            registry_url="quay.io",
+            registry_namespace="test-namespace",
+            registry_username="user-a",
+            registry_password="password-a",
+        )
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            config._buildah_login()
+            config.registry_username = "user-b"
+            config.registry_password = "password-b"
+            config._buildah_login()
+            config.registry_username = "user-a"
+            config.registry_password = "password-a"
+            config._buildah_login()
+
+            assert mock_run.call_count == 3
+
+    def test_login_reruns_when_only_insecure_changes(self, make_config):
+        """Toggling registry_insecure for the same registry and credentials logs in again."""
+        config = make_config(
+            push_images=True,
+            registry_url="quay.io",
+            registry_namespace="test-namespace",
+            registry_username="test-user",
+            registry_password="test-password",
+        )
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            config._buildah_login()
+            config.registry_insecure = True
+            config._buildah_login()
+
+            assert mock_run.call_count == 2
+            assert "--tls-verify=false" in mock_run.call_args_list[1][0][0]
+
+    def test_failed_login_is_not_remembered(self, make_config):
+        """A failed login is retried on the next call."""
+        config = make_config(
+            push_images=True,
+            registry_url="quay.io",
+            registry_namespace="test-namespace",
+            registry_username="test-user",
+            registry_password="test-password",
+        )
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                subprocess.CalledProcessError(returncode=1, cmd=["buildah", "login"], stderr="denied"),
+                MagicMock(returncode=0),
+            ]
+
+            with pytest.raises(ExecutionError):
+                config._buildah_login()
+            config._buildah_login()
+
+            assert mock_run.call_count == 2
+
     def test_insecure_registry_flag(self, make_config):
         """Insecure flag is added to buildah command when registry_insecure is True."""
         config = make_config(
@@ -240,8 +328,7 @@ class TestBuildahLogin:
                 "login",
                 "--username",
                 "test-user",
-                "--password",
-                "test-password",
+                "--password-stdin",
                 "--tls-verify=false",
                 "localhost:5000",
             ]
@@ -271,8 +358,7 @@ class TestBuildahLogin:
                 "login",
                 "--username",
                 "test-user",
-                "--password",
-                "test-password",
+                "--password-stdin",
                 "quay.io",
             ]
             assert call_args[0][0] == expected_cmd
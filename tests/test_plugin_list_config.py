@@ -5,6 +5,8 @@ Tests the plugin list configuration loading and management.
 """
 
 import json
+from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 import yaml
@@ -1950,6 +1952,89 @@ class TestPluginListConfigPopulateBuildArgs:
         assert "--embed-package @backstage/new-experimental" in args
         assert "--shared-package !@backstage/new-experimental" in args
 
+    def test_shared_dependency_manifest_parsed_once(self, tmp_path, monkeypatch):
+        """A node_modules package.json shared by several plugins is read once per pass."""
+        lockfile = tmp_path / "host-yarn.lock"
+        lockfile.write_text("")
+        monkeypatch.setattr(constants, "HOST_LOCKFILE", lockfile)
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        for name in ("a", "b"):
+            _make_plugin_dir(
+                workspace,
+                f"plugins/{name}-backend",
+                f"@test/{name}-backend",
+                "backend-plugin",
+                dependencies={"shared-lib": "^1.0.0"},
+            )
+        _make_node_module(workspace, "shared-lib", dependencies={"@backstage/backend-common": "^1.0.0"})
+        shared_manifest = workspace / "node_modules" / "shared-lib" / "package.json"
+
+        reads: list[Path] = []
+        real_read_text = Path.read_text
+
+        def tracking_read_text(path, *args, **kwargs):
+            reads.append(path)
+            return real_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read_text)
+
+        cfg = PluginListConfig({"plugins/a-backend": "", "plugins/b-backend": ""})
+        cfg.populate_build_args(workspace)
+
+        assert reads.count(shared_manifest) == 1
+        assert "--embed-package shared-lib" in cfg.get_plugins()["plugins/a-backend"]
+        assert "--embed-package shared-lib" in cfg.get_plugins()["plugins/b-backend"]
+
+    def test_repeated_pass_sees_updated_package_json(self, tmp_path, monkeypatch):
+        """Each populate pass re-reads package.json files changed since the previous pass."""
+        lockfile = tmp_path / "host-yarn.lock"
+        lockfile.write_text("")
+        monkeypatch.setattr(constants, "HOST_LOCKFILE", lockfile)
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        _make_plugin_dir(workspace, "plugins/backend", "@test/my-backend", "backend-plugin")
+
+        cfg = PluginListConfig({"plugins/backend": ""})
+        cfg.populate_build_args(workspace)
+        assert cfg.get_plugins()["plugins/backend"] == ""
+
+        _make_plugin_dir(
+            workspace,
+            "plugins/backend",
+            "@test/my-backend",
+            "backend-plugin",
+            dependencies={"@backstage/new-experimental": "^0.1.0"},
+        )
+        cfg.populate_build_args(workspace)
+
+        assert "--embed-package @backstage/new-experimental" in cfg.get_plugins()["plugins/backend"]
+
+    def test_package_json_memo_released_after_each_pass(self, tmp_path, monkeypatch):
+        """Parsed manifests are dropped once create_default and populate_build_args finish."""
+        lockfile = tmp_path / "host-yarn.lock"
+        lockfile.write_text("")
+        monkeypatch.setattr(constants, "HOST_LOCKFILE", lockfile)
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        _make_plugin_dir(
+            workspace,
+            "plugins/backend",
+            "@test/my-backend",
+            "backend-plugin",
+            dependencies={"shared-lib": "^1.0.0"},
+        )
+        _make_node_module(workspace, "shared-lib")
+
+        cfg = PluginListConfig.create_default(workspace)
+        assert PluginListConfig._package_json_cache == {}
+
+        cfg.populate_build_args(workspace)
+        assert PluginListConfig._package_json_cache == {}
+
 
 class TestLogBuildArgsDiff:
     """Tests for PluginListConfig._log_build_args_diff."""
@@ -1968,3 +2053,13 @@ class TestLogBuildArgsDiff:
         before = {"plugins/a": "", "plugins/b": "--keep"}
         after = {"plugins/a": "--new", "plugins/b": "--keep"}
         PluginListConfig._log_build_args_diff(before, after)
+
+    def test_nothing_logged_when_info_disabled(self, monkeypatch):
+        """No per-plugin lines are formatted when INFO logging is disabled."""
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = False
+        monkeypatch.setattr(PluginListConfig, "logger", mock_logger)
+
+        PluginListConfig._log_build_args_diff({"plugins/a": ""}, {"plugins/a": "--new"})
+
+        mock_logger.info.assert_not_called()
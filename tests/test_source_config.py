@@ -5,6 +5,7 @@ Tests the source configuration loading, CLI arg construction, and repository clo
 """
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -38,6 +39,27 @@ class TestSourceConfigFromFile:
         assert config.repo == "https://github.com/awslabs/backstage-plugins-for-aws"
         assert config.repo_ref == "78df9399a81cfd95265cab53815f54210b1d7f50"
 
+    def test_from_file_with_submodules(self, tmp_path):
+        """Test that with-submodules defaults to False and is read when present."""
+        source_data = {"repo": "https://github.com/test/repo", "repo-ref": "main", "workspace-path": "."}
+        source_file = tmp_path / "source.json"
+
+        source_file.write_text(json.dumps(source_data))
+        assert SourceConfig.from_file(source_file).with_submodules is False
+
+        source_file.write_text(json.dumps({**source_data, "with-submodules": True}))
+        assert SourceConfig.from_file(source_file).with_submodules is True
+
+    def test_from_file_invalid_with_submodules(self, tmp_path):
+        """Test that a non-boolean with-submodules value raises ConfigurationError."""
+        source_data = {"repo": "https://github.com/test/repo", "repo-ref": "main", "with-submodules": "yes"}
+
+        source_file = tmp_path / "source.json"
+        source_file.write_text(json.dumps(source_data))
+
+        with pytest.raises(ConfigurationError, match="with-submodules must be true or false"):
+            SourceConfig.from_file(source_file)
+
     def test_from_file_missing_repo(self, tmp_path):
         """Test that missing repo field raises ConfigurationError with descriptive message."""
         source_data = {"repo-ref": "main"}
@@ -215,19 +237,20 @@ class TestSourceConfigCloneToPath:
 
             config.clone_to_path(repo_path)  # Should not raise any exceptions
 
-            assert mock_run.call_count == 2  # clone + checkout
+            assert mock_run.call_count == 1  # shallow clone of the branch, no separate checkout
 
-            # Verify clone command
             clone_call = mock_run.call_args_list[0]
-            assert clone_call[0][0][0] == "git"
-            assert clone_call[0][0][1] == "clone"
-            assert "https://github.com/testowner/testrepo" in clone_call[0][0][2]
-
-            # Verify checkout command
-            checkout_call = mock_run.call_args_list[1]
-            assert checkout_call[0][0][0] == "git"
-            assert checkout_call[0][0][1] == "checkout"
-            assert checkout_call[0][0][2] == "main"
+            assert clone_call[0][0] == [
+                "git",
+                "clone",
+                "--depth=1",
+                "--single-branch",
+                "--branch",
+                "main",
+                "https://github.com/testowner/testrepo",
+                ".",
+            ]
+            assert clone_call[1]["cwd"] == repo_path
 
     def test_clone_to_path_resolved_default_ref(self, tmp_path):
         """Test that clone works correctly when repo_ref was resolved from default branch."""
@@ -249,22 +272,21 @@ class TestSourceConfigCloneToPath:
 
             config.clone_to_path(repo_path)
 
-            # Both clone and checkout should happen
-            assert mock_run.call_count == 2
+            assert mock_run.call_count == 1
 
-            # Verify clone command
+            # The refs/heads/ prefix is stripped for --branch
             clone_call = mock_run.call_args_list[0]
             assert clone_call[0][0] == [
                 "git",
                 "clone",
+                "--depth=1",
+                "--single-branch",
+                "--branch",
+                "main",
                 "https://github.com/testowner/testrepo",
-                str(repo_path),
+                ".",
             ]
 
-            # Verify checkout command with resolved ref
-            checkout_call = mock_run.call_args_list[1]
-            assert checkout_call[0][0] == ["git", "checkout", "refs/heads/main"]
-
     def test_clone_to_path_repo_path_does_not_exist(self, tmp_path):
         """Test that non-existent repo_path raises ConfigurationError."""
         config = SourceConfig(
@@ -299,7 +321,7 @@ class TestSourceConfigCloneToPath:
         """Test that checkout failure raises ExecutionError."""
         config = SourceConfig(
             repo="https://github.com/testowner/testrepo",
-            repo_ref="main",
+            repo_ref="abc1234",  # Abbreviated SHA: full clone + checkout
             workspace_path=".",
         )
 
@@ -313,6 +335,148 @@ class TestSourceConfigCloneToPath:
             with pytest.raises(ExecutionError, match="Failed to checkout ref"):
                 config.clone_to_path(repo_path)
 
+    def test_clone_to_path_full_sha_fetches_single_commit(self, tmp_path):
+        """Test that a full commit SHA is fetched with depth 1 instead of cloning all history."""
+        sha = "0123456789abcdef0123456789abcdef01234567"
+        config = SourceConfig(
+            repo="https://github.com/testowner/testrepo",
+            repo_ref=sha,
+            workspace_path=".",
+        )
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        with patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run:
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path)
+
+            assert [call[0][0] for call in mock_run.call_args_list] == [
+                ["git", "init", "--quiet"],
+                ["git", "remote", "add", "origin", "https://github.com/testowner/testrepo"],
+                ["git", "fetch", "--depth=1", "origin", sha],
+                ["git", "checkout", "--quiet", "--detach", "FETCH_HEAD"],
+            ]
+            assert all(call[1]["cwd"] == repo_path for call in mock_run.call_args_list)
+
+    def test_clone_to_path_abbreviated_sha_uses_full_clone(self, tmp_path):
+        """Test that an abbreviated SHA skips the shallow clone and checks out after a full clone."""
+        config = SourceConfig(
+            repo="https://github.com/testowner/testrepo",
+            repo_ref="abc1234",
+            workspace_path=".",
+        )
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        with patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run:
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path)
+
+            assert [call[0][0] for call in mock_run.call_args_list] == [
+                ["git", "clone", "https://github.com/testowner/testrepo", str(repo_path)],
+                ["git", "checkout", "abc1234"],
+            ]
+
+    def test_clone_to_path_uses_full_clone_when_last_publish_commit_set(self, tmp_path):
+        """Test that INPUTS_LAST_PUBLISH_COMMIT disables the shallow clone so history is available."""
+        config = SourceConfig(
+            repo="https://github.com/testowner/testrepo",
+            repo_ref="main",
+            workspace_path=".",
+        )
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        with (
+            patch.dict(os.environ, {"INPUTS_LAST_PUBLISH_COMMIT": "0123456789abcdef0123456789abcdef01234567"}),
+            patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run,
+        ):
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path)
+
+            assert [call[0][0] for call in mock_run.call_args_list] == [
+                ["git", "clone", "https://github.com/testowner/testrepo", str(repo_path)],
+                ["git", "checkout", "main"],
+            ]
+
+    def test_clone_to_path_falls_back_when_shallow_clone_fails(self, tmp_path):
+        """Test that a failed shallow clone empties the directory and retries with a full clone."""
+        config = SourceConfig(
+            repo="https://github.com/testowner/testrepo",
+            repo_ref="HEAD~1",
+            workspace_path=".",
+        )
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        def fake_run(cmd, *args, **kwargs):
+            if "--depth=1" in cmd:
+                (repo_path / "partial").write_text("left behind by the failed clone")
+                return 128
+            return 0
+
+        with patch(
+            "src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming", side_effect=fake_run
+        ) as mock_run:
+            config.clone_to_path(repo_path)
+
+            commands = [call[0][0] for call in mock_run.call_args_list]
+            assert commands[1:] == [
+                ["git", "clone", "https://github.com/testowner/testrepo", str(repo_path)],
+                ["git", "checkout", "HEAD~1"],
+            ]
+            assert not (repo_path / "partial").exists()
+
+    def test_clone_to_path_with_submodules(self, tmp_path):
+        """Test that submodules are updated in parallel after the ref is checked out."""
+        config = SourceConfig(
+            repo="https://github.com/testowner/testrepo",
+            repo_ref="main",
+            workspace_path=".",
+            with_submodules=True,
+        )
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        with (
+            patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run,
+            patch("os.cpu_count", return_value=3),
+        ):
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path)
+
+            assert mock_run.call_count == 2
+            submodule_call = mock_run.call_args_list[1]
+            assert submodule_call[0][0] == ["git", "submodule", "update", "--init", "--recursive", "--jobs=3"]
+            assert submodule_call[1]["cwd"] == repo_path
+
+    def test_clone_to_path_submodule_update_fails(self, tmp_path):
+        """Test that a failed submodule update raises ExecutionError."""
+        config = SourceConfig(
+            repo="https://github.com/testowner/testrepo",
+            repo_ref="main",
+            workspace_path=".",
+            with_submodules=True,
+        )
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        with patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run:
+            mock_run.side_effect = [0, 1]
+
+            with pytest.raises(ExecutionError, match="Failed to update submodules"):
+                config.clone_to_path(repo_path)
+
     def test_clone_to_path_exception(self, tmp_path):
         """Test that exceptions are wrapped in ExecutionError."""
         config = SourceConfig(
@@ -470,7 +634,7 @@ class TestSourceConfigCloneToPathClean:
                 config.clone_to_path(repo_path)
 
     def test_clean_proceeds_with_clone_after_cleaning(self, tmp_path):
-        """Test that after cleaning nested contents, git clone and checkout are executed."""
+        """Test that after cleaning nested contents, the shallow clone of the tag is executed."""
         config = self._make_config(repo_ref="v1.0.0")
         repo_path = tmp_path / "repo"
         self._make_nested_repo(repo_path)
@@ -481,21 +645,22 @@ class TestSourceConfigCloneToPathClean:
             config.clone_to_path(repo_path, clean=True)
 
             assert list(repo_path.iterdir()) == [], "Directory should be empty before clone runs"
-            assert mock_run.call_count == 2
+            assert mock_run.call_count == 1
 
             clone_call = mock_run.call_args_list[0]
             assert clone_call[0][0] == [
                 "git",
                 "clone",
+                "--depth=1",
+                "--single-branch",
+                "--branch",
+                "v1.0.0",
                 "https://github.com/testowner/testrepo",
-                str(repo_path),
+                ".",
             ]
 
-            checkout_call = mock_run.call_args_list[1]
-            assert checkout_call[0][0] == ["git", "checkout", "v1.0.0"]
-
     def test_prompt_confirm_yes_proceeds_with_clone(self, tmp_path):
-        """Test that after user confirms 'y', nested contents are cleaned and clone/checkout run."""
+        """Test that after user confirms 'y', nested contents are cleaned and the clone runs."""
         config = self._make_config()
         repo_path = tmp_path / "repo"
         self._make_nested_repo(repo_path)
@@ -509,7 +674,96 @@ class TestSourceConfigCloneToPathClean:
             config.clone_to_path(repo_path, clean=False)
 
             assert list(repo_path.iterdir()) == [], "Directory should be empty before clone runs"
-            assert mock_run.call_count == 2
+            assert mock_run.call_count == 1
+
+    @staticmethod
+    def _make_existing_clone(repo_path: Path, origin: str) -> None:
+        """Create a git repository at repo_path whose origin points at the given URL."""
+        repo_path.mkdir(exist_ok=True)
+        subprocess.run(["git", "init", "--quiet"], cwd=repo_path, check=True)
+        subprocess.run(["git", "remote", "add", "origin", origin], cwd=repo_path, check=True)
+        (repo_path / "patched_file.txt").write_text("left over from a previous run")
+
+    def test_clean_updates_existing_clone_in_place(self, tmp_path):
+        """Test that clean=True fetches into an existing clone of the same repo instead of re-cloning."""
+        config = self._make_config(repo_ref="v1.0.0")
+        repo_path = tmp_path / "repo"
+        self._make_existing_clone(repo_path, config.repo)
+
+        with patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run:
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path, clean=True)
+
+            assert [call[0][0] for call in mock_run.call_args_list] == [
+                ["git", "fetch", "--depth=1", "origin", "v1.0.0"],
+                ["git", "checkout", "--quiet", "--force", "--detach", "FETCH_HEAD"],
+                ["git", "clean", "-ffdxq"],
+            ]
+            assert (repo_path / ".git").exists(), "Existing clone should be kept"
+
+    def test_clean_reclones_with_history_when_last_publish_commit_set(self, tmp_path):
+        """Test that INPUTS_LAST_PUBLISH_COMMIT skips the depth-1 in-place update and clones full history."""
+        config = self._make_config()
+        repo_path = tmp_path / "repo"
+        self._make_existing_clone(repo_path, config.repo)
+
+        with (
+            patch.dict(os.environ, {"INPUTS_LAST_PUBLISH_COMMIT": "0123456789abcdef0123456789abcdef01234567"}),
+            patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run,
+        ):
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path, clean=True)
+
+            commands = [call[0][0] for call in mock_run.call_args_list]
+            assert commands[0] == ["git", "clone", config.repo, str(repo_path)]
+            assert not any("--depth=1" in cmd for cmd in commands)
+
+    def test_clean_reclones_when_origin_differs(self, tmp_path):
+        """Test that an existing clone of a different repository is wiped and cloned fresh."""
+        config = self._make_config()
+        repo_path = tmp_path / "repo"
+        self._make_existing_clone(repo_path, "https://github.com/other/repo")
+
+        with patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run:
+            mock_run.return_value = 0
+
+            config.clone_to_path(repo_path, clean=True)
+
+            assert mock_run.call_args_list[0][0][0][:2] == ["git", "clone"]
+            assert list(repo_path.iterdir()) == [], "Directory should be wiped before cloning"
+
+    def test_clean_reclones_when_update_fails(self, tmp_path):
+        """Test that a failed in-place update falls back to wiping the directory and cloning."""
+        config = self._make_config()
+        repo_path = tmp_path / "repo"
+        self._make_existing_clone(repo_path, config.repo)
+
+        with patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run:
+            mock_run.side_effect = [128, 0]  # fetch fails, shallow clone succeeds
+
+            config.clone_to_path(repo_path, clean=True)
+
+            assert mock_run.call_args_list[1][0][0][:2] == ["git", "clone"]
+            assert list(repo_path.iterdir()) == [], "Directory should be wiped before cloning"
+
+    def test_existing_clone_without_clean_still_prompts(self, tmp_path):
+        """Test that an existing clone is not touched without --clean unless the user confirms."""
+        config = self._make_config()
+        repo_path = tmp_path / "repo"
+        self._make_existing_clone(repo_path, config.repo)
+
+        with (
+            patch("src.rhdh_dynamic_plugin_factory.source_config.run_command_with_streaming") as mock_run,
+            patch("builtins.input", return_value="n"),
+        ):
+            with pytest.raises(PluginFactoryError, match="aborted by user"):
+                config.clone_to_path(repo_path, clean=False)
+
+            mock_run.assert_not_called()
+
+        assert (repo_path / "patched_file.txt").exists()
 
     def test_prompt_confirm_no_does_not_clone(self, tmp_path):
         """Test that when user declines, no nested contents are removed and clone does not run."""
@@ -2,7 +2,147 @@
 Unit tests for utility functions.
 """
 
-from src.rhdh_dynamic_plugin_factory.utils import collect_build_logs
+import os
+import sys
+from unittest.mock import patch
+
+import yaml
+from src.rhdh_dynamic_plugin_factory.utils import (
+    collect_build_logs,
+    display_export_results,
+    is_empty_directory,
+    load_env_file,
+    load_yaml,
+    run_command_with_streaming,
+)
+
+
+class TestRunCommandWithStreaming:
+    """Tests for run_command_with_streaming function."""
+
+    @staticmethod
+    def _python(code):
+        return [sys.executable, "-c", code]
+
+    def test_streams_stdout_and_stderr_lines(self, mock_logger):
+        """Test that stdout lines go to info and stderr lines go to the stderr log function."""
+        stderr_lines = []
+        code = "import sys; print('out 1'); print('out 2'); print('err 1', file=sys.stderr)"
+
+        returncode = run_command_with_streaming(self._python(code), mock_logger, stderr_log_func=stderr_lines.append)
+
+        assert returncode == 0
+        assert [call.args[0] for call in mock_logger.info.call_args_list] == ["out 1", "out 2"]
+        assert stderr_lines == ["err 1"]
+
+    def test_returns_nonzero_exit_code(self, mock_logger):
+        """Test that the process exit code is returned."""
+        assert run_command_with_streaming(self._python("raise SystemExit(3)"), mock_logger) == 3
+
+    def test_handles_output_larger_than_one_read(self, mock_logger):
+        """Test that lines spanning several read chunks are reassembled in order."""
+        code = "for i in range(20000): print(f'line {i:05d} ' + 'x' * 20)"
+
+        run_command_with_streaming(self._python(code), mock_logger)
+
+        lines = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert len(lines) == 20000
+        assert lines[0] == "line 00000 " + "x" * 20
+        assert lines[-1] == "line 19999 " + "x" * 20
+
+    def test_drains_both_pipes_without_deadlock(self, mock_logger):
+        """Test that heavy stderr output does not block while stdout is still open."""
+        stderr_lines = []
+        code = "import sys\nfor i in range(5000): print(f'err {i}', file=sys.stderr)\nsys.stderr.flush()\nprint('done')"
+
+        returncode = run_command_with_streaming(self._python(code), mock_logger, stderr_log_func=stderr_lines.append)
+
+        assert returncode == 0
+        assert len(stderr_lines) == 5000
+        assert stderr_lines[-1] == "err 4999"
+        assert [call.args[0] for call in mock_logger.info.call_args_list] == ["done"]
+
+    def test_normalizes_line_endings_and_flushes_partial_line(self, mock_logger):
+        """Test that \\r\\n and bare \\r split lines and a final line without newline is logged."""
+        code = "import sys; sys.stdout.write('a\\r\\nb\\rc\\nno newline')"
+
+        run_command_with_streaming(self._python(code), mock_logger)
+
+        assert [call.args[0] for call in mock_logger.info.call_args_list] == ["a", "b", "c", "no newline"]
+
+    def test_decodes_utf8_and_replaces_invalid_bytes(self, mock_logger):
+        """Test that multi-byte UTF-8 output is decoded and invalid bytes do not raise."""
+        code = "import sys; sys.stdout.buffer.write('✓ done\\n'.encode() + b'bad \\xff\\n')"
+
+        run_command_with_streaming(self._python(code), mock_logger)
+
+        assert [call.args[0] for call in mock_logger.info.call_args_list] == ["✓ done", "bad \ufffd"]
+
+    def test_disabled_levels_are_drained_without_logging(self, caplog):
+        """Test that output for disabled log levels is read to completion but never logged."""
+        import logging
+
+        logger = logging.getLogger("rhdh_dynamic_plugin_factory.test_disabled_levels")
+        caplog.set_level(logging.ERROR, logger=logger.name)
+        code = "import sys\nfor i in range(20000): print(f'out {i}'); print(f'err {i}', file=sys.stderr)"
+
+        with patch.object(logger, "_log") as mock_log:
+            returncode = run_command_with_streaming(self._python(code), logger)
+
+        assert returncode == 0
+        mock_log.assert_not_called()
+
+    def test_output_is_not_parsed_as_rich_markup(self):
+        """Test that subprocess output containing markup-like brackets is printed verbatim."""
+        import io
+        import logging
+
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        stream = io.StringIO()
+        logger = logging.getLogger("rhdh_dynamic_plugin_factory.test_plain_output")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = RichHandler(console=Console(file=stream, width=200), show_time=False, show_path=False, markup=True)
+        logger.addHandler(handler)
+        try:
+            code = "import sys; print('[bold]not bold[/bold] [/oops]'); print('[x]', file=sys.stderr)"
+            run_command_with_streaming(self._python(code), logger)
+        finally:
+            logger.removeHandler(handler)
+
+        output = stream.getvalue()
+        assert "[bold]not bold[/bold] [/oops]" in output
+        assert "[x]" in output
+
+
+class TestDisplayExportResults:
+    """Tests for display_export_results function."""
+
+    def test_no_output_files(self, tmp_path, mock_logger):
+        """Test that missing output files mean no failures and nothing is logged."""
+        assert display_export_results(tmp_path, mock_logger) is False
+        mock_logger.error.assert_not_called()
+        mock_logger.info.assert_not_called()
+
+    def test_empty_output_files(self, tmp_path, mock_logger):
+        """Test that empty or blank output files are treated as no results."""
+        (tmp_path / "failed-exports-output").write_text("")
+        (tmp_path / "published-exports-output").write_text("\n\n")
+
+        assert display_export_results(tmp_path, mock_logger) is False
+        mock_logger.error.assert_not_called()
+        mock_logger.info.assert_not_called()
+
+    def test_reports_failed_and_published_exports(self, tmp_path, mock_logger):
+        """Test that failures are reported and published images are listed one per line."""
+        (tmp_path / "failed-exports-output").write_text("plugins/a\n\nplugins/b\n")
+        (tmp_path / "published-exports-output").write_text("quay.io/ns/c:1.0\n")
+
+        assert display_export_results(tmp_path, mock_logger) is True
+        mock_logger.error.assert_called_once_with("Failed exports (2): plugins/a, plugins/b")
+        mock_logger.info.assert_any_call("  - quay.io/ns/c:1.0")
 
 
 class TestCollectBuildLogs:
@@ -105,3 +245,88 @@ class TestCollectBuildLogs:
         mock_logger.warning.assert_any_call(
             "[yellow]Found 3 build log(s) that may contain details about the failure:[/yellow]"
         )
+
+
+class TestIsEmptyDirectory:
+    """Tests for is_empty_directory function."""
+
+    def test_empty_directory(self, tmp_path):
+        """Test that a directory without entries is empty."""
+        assert is_empty_directory(tmp_path) is True
+
+    def test_missing_directory_counts_as_empty(self, tmp_path):
+        """Test that a non-existent directory is treated as empty."""
+        assert is_empty_directory(tmp_path / "missing") is True
+
+    def test_hidden_entry_makes_directory_non_empty(self, tmp_path):
+        """Test that a single dotfile (e.g. .git) makes the directory non-empty."""
+        (tmp_path / ".git").mkdir()
+
+        assert is_empty_directory(str(tmp_path)) is False
+
+
+class TestLoadYaml:
+    """Tests for load_yaml function."""
+
+    def test_parses_mapping_with_null_values(self, tmp_path):
+        """Test that keys without values are parsed as None."""
+        yaml_file = tmp_path / "plugins-list.yaml"
+        yaml_file.write_text("plugins/todo:\nplugins/todo-backend: --embed-package foo\n")
+
+        assert load_yaml(yaml_file) == {
+            "plugins/todo": None,
+            "plugins/todo-backend": "--embed-package foo",
+        }
+
+    def test_empty_file_returns_none(self, tmp_path):
+        """Test that an empty file parses to None."""
+        yaml_file = tmp_path / "empty.yaml"
+        yaml_file.write_text("")
+
+        assert load_yaml(yaml_file) is None
+
+    def test_falls_back_to_pure_python_loader(self, tmp_path, monkeypatch):
+        """Test that the pure-Python SafeLoader is used when libyaml is unavailable."""
+        yaml_file = tmp_path / "plugins-list.yaml"
+        yaml_file.write_text("plugins/todo:\n")
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            assert load_yaml(yaml_file) == {"plugins/todo": None}
+
+        assert mock_load.call_args.kwargs["Loader"] is yaml.SafeLoader
+
+
+class TestLoadEnvFile:
+    """Tests for load_env_file function."""
+
+    def test_loads_variables_into_environment(self, tmp_path):
+        """Test that variables from an existing file are loaded and True is returned."""
+        env_file = tmp_path / ".env"
+        env_file.write_text('RHDH_TEST_ENV_VAR="from file"\n')
+
+        # patch.dict restores os.environ afterwards, including removing the loaded variable
+        with patch.dict(os.environ):
+            os.environ.pop("RHDH_TEST_ENV_VAR", None)
+
+            assert load_env_file(env_file) is True
+            assert os.environ["RHDH_TEST_ENV_VAR"] == "from file"
+
+    def test_respects_override_flag(self, tmp_path, monkeypatch):
+        """Test that existing variables are only replaced when override=True."""
+        monkeypatch.setenv("RHDH_TEST_ENV_VAR", "from env")
+        env_file = tmp_path / ".env"
+        env_file.write_text("RHDH_TEST_ENV_VAR=from file\n")
+
+        load_env_file(env_file)
+        assert os.environ["RHDH_TEST_ENV_VAR"] == "from env"
+
+        load_env_file(env_file, override=True)
+        assert os.environ["RHDH_TEST_ENV_VAR"] == "from file"
+
+    def test_missing_file_returns_false(self, tmp_path):
+        """Test that a missing file is skipped without importing or calling dotenv."""
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            assert load_env_file(tmp_path / "missing.env") is False
+
+        mock_load_dotenv.assert_not_called()